@@ -7,11 +7,11 @@ Main Flask Application
 import csv
 import io
 import json
-import queue
 import socket
 import sqlite3
 import threading
 import time
+from contextlib import closing
 from datetime import datetime
 from typing import Any
 
@@ -19,16 +19,25 @@ from flask import Flask, Response, jsonify, render_template, request
 
 # Import our custom modules
 from src.audio_capture import AudioCapture
+from src.config import configure_logging
 from src.llm_processor import LLMProcessor
+from src.models import SessionRepository
+from src.services.audio_service import AUDIO_LEVEL_INTERVAL
+from src.services.event_buffer import EventRing, event_timestamp, sse_frame
 from src.whisper_stream_processor import WhisperStreamProcessor
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "your-secret-key-here"
 
-# SSE streaming queue
-stream_queue: queue.Queue[dict[str, Any]] = queue.Queue(
-    maxsize=1000
-)  # Prevent memory issues
+# SSE event stream (bounded ring shared by every SSE client; the oldest events
+# are overwritten when it wraps)
+stream_queue = EventRing(size=1024)
+
+# Latest audio levels for the SSE stream. The audio thread overwrites this slot
+# instead of queueing every reading; /stream forwards it at its own cadence.
+latest_audio_levels: dict[str, Any] = {}
+audio_levels_seq = 0  # bumped on every level update
+audio_levels_lock = threading.Lock()
 
 # Global state
 recording_state = {"is_recording": False, "session_id": None, "start_time": None}
@@ -60,28 +69,24 @@ def on_whisper_transcript(event_data):
             save_raw_transcript(transcript_data)
 
             # Send via SSE
-            stream_queue.put(
+            stream_queue.publish(
                 {
                     "type": "raw_transcript",
                     "data": transcript_data,
                     "accumulated_count": event_data["accumulated_count"],
-                },
-                block=False,
+                }
             )
 
         elif event_data["type"] == "error":
             # Send error via SSE
-            stream_queue.put(
+            stream_queue.publish(
                 {
                     "type": "whisper_error",
                     "message": event_data["message"],
                     "session_id": event_data["session_id"],
-                },
-                block=False,
+                }
             )
 
-    except queue.Full:
-        print("⚠️ Stream queue full, dropping whisper event")
     except Exception as e:
         print(f"❌ Error in whisper callback: {e}")
 
@@ -91,14 +96,13 @@ def on_llm_result(event_data):
     try:
         if event_data["type"] == "llm_processing_start":
             # Send processing start via SSE
-            stream_queue.put(
+            stream_queue.publish(
                 {
                     "type": "llm_processing_start",
                     "job_id": event_data["job_id"],
                     "session_id": event_data["session_id"],
                     "transcript_count": event_data["transcript_count"],
-                },
-                block=False,
+                }
             )
 
         elif event_data["type"] == "llm_processing_complete":
@@ -108,13 +112,12 @@ def on_llm_result(event_data):
                 save_processed_transcript(result)
 
             # Send completion via SSE
-            stream_queue.put(
+            stream_queue.publish(
                 {
                     "type": "llm_processing_complete",
                     "job_id": event_data["job_id"],
                     "result": result,
-                },
-                block=False,
+                }
             )
 
             # Check if this session is waiting for summary generation
@@ -127,17 +130,14 @@ def on_llm_result(event_data):
 
         elif event_data["type"] == "llm_processing_error":
             # Send error via SSE
-            stream_queue.put(
+            stream_queue.publish(
                 {
                     "type": "llm_processing_error",
                     "job_id": event_data["job_id"],
                     "error": event_data["error"],
-                },
-                block=False,
+                }
             )
 
-    except queue.Full:
-        print("⚠️ Stream queue full, dropping LLM event")
     except Exception as e:
         print(f"❌ Error in LLM callback: {e}")
 
@@ -186,15 +186,15 @@ def auto_process_transcripts():
         if not recording_state["is_recording"] or not auto_processing_state["enabled"]:
             return
 
-        # Check if we have accumulated transcripts
+        # Take accumulated transcripts (clearing them in the same step)
         accumulated_transcripts = []
         if mic_whisper_processor:
             accumulated_transcripts.extend(
-                mic_whisper_processor.get_accumulated_transcripts()
+                mic_whisper_processor.pop_accumulated_transcripts()
             )
         if system_whisper_processor:
             accumulated_transcripts.extend(
-                system_whisper_processor.get_accumulated_transcripts()
+                system_whisper_processor.pop_accumulated_transcripts()
             )
 
         if len(accumulated_transcripts) == 0:
@@ -216,28 +216,19 @@ def auto_process_transcripts():
             accumulated_transcripts, session_id
         )
 
-        # Clear accumulated transcripts after sending to LLM
-        mic_whisper_processor.clear_accumulated_transcripts()
-        if system_whisper_processor:
-            system_whisper_processor.clear_accumulated_transcripts()
-
         # Update last processing time
         auto_processing_state["last_processing_time"] = datetime.now().isoformat()
 
         # Send auto-processing notification via SSE
-        try:
-            stream_queue.put(
-                {
-                    "type": "auto_processing_triggered",
-                    "job_id": job_id,
-                    "transcript_count": len(accumulated_transcripts),
-                    "interval_minutes": auto_processing_state["interval_minutes"],
-                    "timestamp": auto_processing_state["last_processing_time"],
-                },
-                block=False,
-            )
-        except queue.Full:
-            print("⚠️ Stream queue full, dropping auto-processing notification")
+        stream_queue.publish(
+            {
+                "type": "auto_processing_triggered",
+                "job_id": job_id,
+                "transcript_count": len(accumulated_transcripts),
+                "interval_minutes": auto_processing_state["interval_minutes"],
+                "timestamp": auto_processing_state["last_processing_time"],
+            }
+        )
 
         # Restart timer for next interval
         start_auto_processing_timer()
@@ -260,17 +251,34 @@ def stream():
 
     def event_stream():
         heartbeat_counter = 0
+        last_sent = time.monotonic()
+        subscription = stream_queue.subscribe()
+        with audio_levels_lock:
+            levels_seq = audio_levels_seq
         while True:
             try:
-                # Get data from queue (blocks until available)
-                data = stream_queue.get(timeout=1)
-                yield f"data: {json.dumps(data)}\n\n"
-            except queue.Empty:
+                # Wake at the audio level cadence to forward the latest levels.
+                # Events come out of the ring already serialized.
+                frames = subscription.read(timeout=AUDIO_LEVEL_INTERVAL)
+
+                levels, levels_seq = take_audio_levels(levels_seq)
+                if levels:
+                    frames.append(sse_frame(levels))
+
+                if frames:
+                    last_sent = time.monotonic()
+                    yield "".join(frames)
+                    continue
+
+                if time.monotonic() - last_sent < 1:
+                    continue
+                last_sent = time.monotonic()
+
                 # Send heartbeat with periodic state validation
                 heartbeat_counter += 1
                 heartbeat_data = {
                     "type": "heartbeat",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": event_timestamp(),
                 }
 
                 # Include state validation every 10 heartbeats (every ~10 seconds)
@@ -284,7 +292,7 @@ def stream():
                         f"🔄 Sending state sync heartbeat: {heartbeat_data['state_sync']}"
                     )
 
-                yield f"data: {json.dumps(heartbeat_data)}\n\n"
+                yield sse_frame(heartbeat_data)
             except Exception as e:
                 print(f"SSE stream error: {e}")
                 break
@@ -317,11 +325,7 @@ def get_status():
             if hasattr(mic_whisper_processor, "is_streaming")
             else False
         )
-        try:
-            mic_transcripts = mic_whisper_processor.get_accumulated_transcripts()
-            mic_count = len(mic_transcripts) if mic_transcripts else 0
-        except Exception:
-            mic_count = 0
+        mic_count = mic_whisper_processor.accumulated_count
 
     if system_whisper_processor:
         system_active = (
@@ -329,11 +333,7 @@ def get_status():
             if hasattr(system_whisper_processor, "is_streaming")
             else False
         )
-        try:
-            system_transcripts = system_whisper_processor.get_accumulated_transcripts()
-            system_count = len(system_transcripts) if system_transcripts else 0
-        except Exception:
-            system_count = 0
+        system_count = system_whisper_processor.accumulated_count
 
     # Get audio capture state
     audio_capture_active = False
@@ -636,19 +636,15 @@ def start_recording():
         create_session_record(session_id, start_time.isoformat())
 
         # Send recording started message via SSE
-        try:
-            stream_queue.put(
-                {
-                    "type": "recording_started",
-                    "session_id": session_id,
-                    "timestamp": datetime.now().isoformat(),
-                    "message": "🎯 Whisper.cpp streaming started! Ready for transcription.",
-                    "processor_type": "whisper_stream",
-                },
-                block=False,
-            )
-        except queue.Full:
-            print("⚠️ Stream queue full, dropping message")
+        stream_queue.publish(
+            {
+                "type": "recording_started",
+                "session_id": session_id,
+                "timestamp": datetime.now().isoformat(),
+                "message": "🎯 Whisper.cpp streaming started! Ready for transcription.",
+                "processor_type": "whisper_stream",
+            }
+        )
 
         # Start whisper.cpp streaming for microphone
         mic_success = mic_whisper_processor.start_streaming(session_id)
@@ -756,19 +752,15 @@ def stop_recording():
         )
 
         # Send recording stopped message via SSE
-        try:
-            stream_queue.put(
-                {
-                    "type": "recording_stopped",
-                    "session_id": session_id,
-                    "timestamp": datetime.now().isoformat(),
-                    "message": "🛑 Whisper.cpp streaming stopped.",
-                    "stats": stats,
-                },
-                block=False,
-            )
-        except queue.Full:
-            print("⚠️ Stream queue full, dropping message")
+        stream_queue.publish(
+            {
+                "type": "recording_stopped",
+                "session_id": session_id,
+                "timestamp": datetime.now().isoformat(),
+                "message": "🛑 Whisper.cpp streaming stopped.",
+                "stats": stats,
+            }
+        )
 
         # Update session with end time and duration
         end_time = datetime.now()
@@ -850,18 +842,14 @@ def pause_recording():
             ), 500
 
         # Send pause message via SSE
-        try:
-            stream_queue.put(
-                {
-                    "type": "recording_paused",
-                    "session_id": recording_state["session_id"],
-                    "timestamp": datetime.now().isoformat(),
-                    "message": "⏸️ Recording paused",
-                },
-                block=False,
-            )
-        except queue.Full:
-            print("⚠️ Stream queue full, dropping pause message")
+        stream_queue.publish(
+            {
+                "type": "recording_paused",
+                "session_id": recording_state["session_id"],
+                "timestamp": datetime.now().isoformat(),
+                "message": "⏸️ Recording paused",
+            }
+        )
 
         return jsonify(
             {"success": True, "message": "Recording paused", "results": results}
@@ -909,18 +897,14 @@ def resume_recording():
             ), 500
 
         # Send resume message via SSE
-        try:
-            stream_queue.put(
-                {
-                    "type": "recording_resumed",
-                    "session_id": recording_state["session_id"],
-                    "timestamp": datetime.now().isoformat(),
-                    "message": "▶️ Recording resumed",
-                },
-                block=False,
-            )
-        except queue.Full:
-            print("⚠️ Stream queue full, dropping resume message")
+        stream_queue.publish(
+            {
+                "type": "recording_resumed",
+                "session_id": recording_state["session_id"],
+                "timestamp": datetime.now().isoformat(),
+                "message": "▶️ Recording resumed",
+            }
+        )
 
         return jsonify(
             {"success": True, "message": "Recording resumed", "results": results}
@@ -1160,13 +1144,13 @@ def process_llm():
         # Get accumulated transcripts from both sources
         accumulated_transcripts = []
 
-        # Add microphone transcripts
-        mic_transcripts = mic_whisper_processor.get_accumulated_transcripts()
+        # Take microphone transcripts (clearing them in the same step)
+        mic_transcripts = mic_whisper_processor.pop_accumulated_transcripts()
         accumulated_transcripts.extend(mic_transcripts)
 
-        # Add system audio transcripts if available
+        # Take system audio transcripts if available
         if system_whisper_processor:
-            system_transcripts = system_whisper_processor.get_accumulated_transcripts()
+            system_transcripts = system_whisper_processor.pop_accumulated_transcripts()
             accumulated_transcripts.extend(system_transcripts)
 
         if not accumulated_transcripts:
@@ -1180,11 +1164,6 @@ def process_llm():
             accumulated_transcripts, session_id
         )
 
-        # Clear accumulated transcripts after sending to LLM
-        mic_whisper_processor.clear_accumulated_transcripts()
-        if system_whisper_processor:
-            system_whisper_processor.clear_accumulated_transcripts()
-
         return jsonify(
             {
                 "success": True,
@@ -1550,12 +1529,10 @@ def generate_session_summary_endpoint(session_id):
     """Manually generate summary for a session"""
     try:
         # Use the session service to generate summary
-        import queue
-
         from src.services.session_service import SessionService
 
         # Create a temporary session service for this operation
-        temp_queue = queue.Queue()
+        temp_queue = EventRing()
         session_service = SessionService(temp_queue)
 
         result = session_service.generate_summary_for_session(session_id)
@@ -1833,6 +1810,10 @@ def get_audio_devices():
     try:
         from src.sdl_device_mapper import SDLDeviceMapper
 
+        # Device lists are cached; an explicit refresh re-enumerates them
+        if request.args.get("refresh"):
+            SDLDeviceMapper.invalidate()
+
         mapper = SDLDeviceMapper()
         device_info = mapper.get_device_info()
 
@@ -1937,11 +1918,22 @@ def extract_new_content(last_text, current_text):
     # return ""
 
 
+def take_audio_levels(since_seq):
+    """Get the latest audio levels if they changed after since_seq
+
+    Returns (levels or None, seq) so each SSE client tracks its own position.
+    """
+    with audio_levels_lock:
+        if audio_levels_seq == since_seq:
+            return None, since_seq
+        return dict(latest_audio_levels), audio_levels_seq
+
+
 def on_audio_chunk(
     audio_data, source="microphone", audio_level=None, is_transcription=False
 ):
     """Callback for when new audio data is available"""
-    global transcript_processor
+    global transcript_processor, audio_levels_seq
 
     # Initialize transcript tracking for deduplication
     if not hasattr(on_audio_chunk, "last_transcript"):
@@ -1957,7 +1949,7 @@ def on_audio_chunk(
 
     # Handle audio level updates
     if audio_level is not None:
-        level_data = {"type": "audio_level", "timestamp": datetime.now().isoformat()}
+        level_data = {"type": "audio_level", "timestamp": event_timestamp()}
         if source == "microphone":
             level_data["microphone_level"] = audio_level
             # Console log for microphone levels (show percentage and bar visualization)
@@ -1973,13 +1965,10 @@ def on_audio_chunk(
             bar = "█" * bar_length + "░" * (50 - bar_length)
             print(f"🔊 Sys Level: {percentage:5.1f}% |{bar}|")
 
-        # Send audio level via SSE queue
-        try:
-            stream_queue.put(level_data, block=False)
-            # print(f"🔊 Audio level queued: {level_data}")
-        except queue.Full:
-            # Skip if queue is full (audio levels are frequent)
-            pass
+        # Publish the latest level for the SSE stream
+        with audio_levels_lock:
+            latest_audio_levels.update(level_data)
+            audio_levels_seq += 1
 
     # Handle transcription processing
     if is_transcription and transcript_processor:
@@ -2007,7 +1996,7 @@ def on_audio_chunk(
                     transcript_data = {
                         "type": "transcript_update",
                         "session_id": recording_state["session_id"],
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": event_timestamp(),
                         "source": source,
                         "text": new_content,  # Deduplicated new content
                         "raw_text": current_text,  # Full raw transcript
@@ -2015,11 +2004,8 @@ def on_audio_chunk(
                         "is_final": transcript_result.get("is_final", False),
                         "is_deduplicated": True,
                     }
-                    try:
-                        stream_queue.put(transcript_data, block=False)
-                        print(f"📤 New transcript queued: {transcript_data}")
-                    except queue.Full:
-                        print("⚠️ Stream queue full, dropping transcript")
+                    stream_queue.publish(transcript_data)
+                    print(f"📤 New transcript queued: {transcript_data}")
                 else:
                     print(f"🔄 Duplicate content ignored ({source})")
         except Exception as e:
@@ -2240,33 +2226,36 @@ def init_database():
     conn.commit()
     conn.close()
 
+    # The sessions columns may have changed; re-read them on the next lookup
+    SessionRepository.invalidate_session_columns()
+
 
 def save_raw_transcript(transcript_data):
     """Save raw transcript from whisper.cpp to database"""
     try:
-        conn = sqlite3.connect("transcripts.db")
-        cursor = conn.cursor()
+        with closing(sqlite3.connect("transcripts.db")) as conn:
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO raw_transcripts
-            (id, session_id, text, timestamp, sequence_number, confidence, processing_time, audio_source)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                transcript_data["id"],
-                transcript_data["session_id"],
-                transcript_data["text"],
-                transcript_data["timestamp"],
-                transcript_data["sequence_number"],
-                transcript_data.get("confidence"),
-                transcript_data.get("processing_time"),
-                transcript_data.get("audio_source", "unknown"),
-            ),
-        )
+            cursor.execute(
+                """
+                INSERT INTO raw_transcripts
+                (id, session_id, text, timestamp, sequence_number, confidence, processing_time, audio_source)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    transcript_data["id"],
+                    transcript_data["session_id"],
+                    transcript_data["text"],
+                    transcript_data["timestamp"],
+                    transcript_data["sequence_number"],
+                    transcript_data.get("confidence"),
+                    transcript_data.get("processing_time"),
+                    transcript_data.get("audio_source", "unknown"),
+                ),
+            )
+
+            conn.commit()
 
-        conn.commit()
-        conn.close()
         return True
 
     except Exception as e:
@@ -2277,33 +2266,33 @@ def save_raw_transcript(transcript_data):
 def save_processed_transcript(processed_data):
     """Save LLM-processed transcript to database"""
     try:
-        conn = sqlite3.connect("transcripts.db")
-        cursor = conn.cursor()
+        with closing(sqlite3.connect("transcripts.db")) as conn:
+            cursor = conn.cursor()
 
-        # Convert transcript IDs list to JSON string
-        transcript_ids_json = json.dumps(processed_data["original_transcript_ids"])
+            # Convert transcript IDs list to JSON string
+            transcript_ids_json = json.dumps(processed_data["original_transcript_ids"])
 
-        cursor.execute(
-            """
-            INSERT INTO processed_transcripts
-            (id, session_id, processed_text, original_transcript_ids,
-             original_transcript_count, llm_model, processing_time, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                processed_data["id"],
-                processed_data["session_id"],
-                processed_data["processed_text"],
-                transcript_ids_json,
-                processed_data["original_transcript_count"],
-                processed_data["llm_model"],
-                processed_data["processing_time"],
-                processed_data["timestamp"],
-            ),
-        )
+            cursor.execute(
+                """
+                INSERT INTO processed_transcripts
+                (id, session_id, processed_text, original_transcript_ids,
+                 original_transcript_count, llm_model, processing_time, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    processed_data["id"],
+                    processed_data["session_id"],
+                    processed_data["processed_text"],
+                    transcript_ids_json,
+                    processed_data["original_transcript_count"],
+                    processed_data["llm_model"],
+                    processed_data["processing_time"],
+                    processed_data["timestamp"],
+                ),
+            )
+
+            conn.commit()
 
-        conn.commit()
-        conn.close()
         return True
 
     except Exception as e:
@@ -2331,7 +2320,7 @@ def get_session_transcripts(session_id, transcript_type="both"):
             )
 
             raw_transcripts = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 raw_transcripts.append(
                     {
                         "id": row[0],
@@ -2358,7 +2347,7 @@ def get_session_transcripts(session_id, transcript_type="both"):
             )
 
             processed_transcripts = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 processed_transcripts.append(
                     {
                         "id": row[0],
@@ -2713,16 +2702,21 @@ def process_remaining_transcripts_before_stop(session_id):
     global mic_whisper_processor, system_whisper_processor, llm_processor
 
     try:
-        # Get accumulated transcripts from both processors
+        if not llm_processor:
+            print("⚠️ No LLM processor available for remaining transcripts")
+            return
+
+        # Take accumulated transcripts from both processors, clearing them in
+        # the same step so nothing arriving during stop is lost
         accumulated_transcripts = []
 
         if mic_whisper_processor:
-            mic_transcripts = mic_whisper_processor.get_accumulated_transcripts()
+            mic_transcripts = mic_whisper_processor.pop_accumulated_transcripts()
             accumulated_transcripts.extend(mic_transcripts)
             print(f"📝 Found {len(mic_transcripts)} accumulated mic transcripts")
 
         if system_whisper_processor:
-            system_transcripts = system_whisper_processor.get_accumulated_transcripts()
+            system_transcripts = system_whisper_processor.pop_accumulated_transcripts()
             accumulated_transcripts.extend(system_transcripts)
             print(f"📝 Found {len(system_transcripts)} accumulated system transcripts")
 
@@ -2734,22 +2728,11 @@ def process_remaining_transcripts_before_stop(session_id):
             # Sort transcripts by timestamp to maintain chronological order
             accumulated_transcripts.sort(key=lambda x: x.get("timestamp", ""))
 
-            # Process with LLM synchronously (wait for completion)
-            if llm_processor:
-                job_id = llm_processor.process_transcripts_async(
-                    accumulated_transcripts, session_id
-                )
-                print(
-                    f"📝 Started LLM processing job {job_id} for remaining transcripts"
-                )
-
-                # Clear accumulated transcripts after sending to LLM
-                if mic_whisper_processor:
-                    mic_whisper_processor.clear_accumulated_transcripts()
-                if system_whisper_processor:
-                    system_whisper_processor.clear_accumulated_transcripts()
-            else:
-                print("⚠️ No LLM processor available for remaining transcripts")
+            # Process with LLM asynchronously
+            job_id = llm_processor.process_transcripts_async(
+                accumulated_transcripts, session_id
+            )
+            print(f"📝 Started LLM processing job {job_id} for remaining transcripts")
         else:
             print("📝 No remaining transcripts to process")
 
@@ -2759,7 +2742,6 @@ def process_remaining_transcripts_before_stop(session_id):
 
 def generate_session_summary_async(session_id):
     """Generate session summary asynchronously after session ends."""
-    import queue
     import threading
 
     from src.services.session_service import SessionService
@@ -2767,7 +2749,7 @@ def generate_session_summary_async(session_id):
     def _generate_summary():
         try:
             # Create a temporary session service for this operation
-            temp_queue = queue.Queue()
+            temp_queue = EventRing()
             session_service = SessionService(temp_queue)
 
             # Wait a bit for any pending LLM processing to complete
@@ -2784,39 +2766,31 @@ def generate_session_summary_async(session_id):
                 )
 
                 # Send summary event via SSE
-                try:
-                    stream_queue.put(
-                        {
-                            "type": "session_summary_generated",
-                            "session_id": session_id,
-                            "summary": result["summary"],
-                            "keywords": result["keywords"],
-                            "message": "📝 Session summary generated",
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                        block=False,
-                    )
-                except queue.Full:
-                    print("⚠️ Stream queue full, dropping summary event")
+                stream_queue.publish(
+                    {
+                        "type": "session_summary_generated",
+                        "session_id": session_id,
+                        "summary": result["summary"],
+                        "keywords": result["keywords"],
+                        "message": "📝 Session summary generated",
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
             else:
                 print(
                     f"❌ Failed to generate summary for session {session_id}: {result['error']}"
                 )
 
                 # Send error event via SSE
-                try:
-                    stream_queue.put(
-                        {
-                            "type": "session_summary_error",
-                            "session_id": session_id,
-                            "error": result["error"],
-                            "message": "❌ Failed to generate session summary",
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                        block=False,
-                    )
-                except queue.Full:
-                    print("⚠️ Stream queue full, dropping summary error event")
+                stream_queue.publish(
+                    {
+                        "type": "session_summary_error",
+                        "session_id": session_id,
+                        "error": result["error"],
+                        "message": "❌ Failed to generate session summary",
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
 
         except Exception as e:
             print(f"❌ Error in summary generation thread: {e}")
@@ -2843,6 +2817,9 @@ def find_available_port(start_port=5001, max_attempts=10):
 
 
 if __name__ == "__main__":
+    # Service modules log through a background writer thread
+    configure_logging()
+
     # Initialize database
     init_database()
 
@@ -8,12 +8,52 @@ import os
 import threading
 import time
 import wave
-from collections import deque
 
 import numpy as np
 import pyaudio
 
 
+class AudioRingBuffer:
+    """Fixed-size ring of int16 samples holding the most recent audio
+
+    Reads are copied into one preallocated array instead of keeping a deque
+    of per-read bytes objects, so steady-state recording allocates nothing per
+    read. Written and read from the recording thread only.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._ring = np.zeros(capacity, dtype=np.int16)
+        self._capacity = capacity
+        self._written = 0  # total samples ever appended
+
+    def __len__(self) -> int:
+        return min(self._written, self._capacity)
+
+    def append(self, data: bytes) -> None:
+        """Append raw 16-bit PCM bytes, overwriting the oldest samples"""
+        samples = np.frombuffer(data, dtype=np.int16)[-self._capacity :]
+        start = (self._written + len(data) // 2 - samples.size) % self._capacity
+        first = min(samples.size, self._capacity - start)
+        self._ring[start : start + first] = samples[:first]
+        self._ring[: samples.size - first] = samples[first:]
+        self._written += len(data) // 2
+
+    def latest(self, count: int) -> bytes:
+        """Get the most recent `count` samples as PCM bytes"""
+        count = min(count, len(self))
+        start = (self._written - count) % self._capacity
+        if start + count <= self._capacity:
+            return self._ring[start : start + count].tobytes()
+        return (
+            self._ring[start:].tobytes()
+            + self._ring[: start + count - self._capacity].tobytes()
+        )
+
+    def getvalue(self) -> bytes:
+        """Get all buffered samples, oldest first, as PCM bytes"""
+        return self.latest(len(self))
+
+
 class AudioCapture:
     def __init__(self, sample_rate=16000, channels=1, chunk_size=1024):
         self.sample_rate = sample_rate
@@ -26,9 +66,12 @@ class AudioCapture:
         self.recording_thread = None
         self.callback = None
 
-        # Audio buffers
-        self.mic_buffer = deque(maxlen=200)  # Keep last 200 chunks (~12 seconds)
-        self.system_buffer = deque(maxlen=200)
+        # Audio buffers: keep the last 200 chunks (~12 seconds)
+        chunk_samples = chunk_size * channels
+        self.mic_buffer = AudioRingBuffer(200 * chunk_samples)
+        self.system_buffer = AudioRingBuffer(200 * chunk_samples)
+        # Transcription windows cover the last 50 chunks (~3 seconds)
+        self._transcription_samples = 50 * chunk_samples
 
         # Device IDs
         self.mic_device_id = None
@@ -126,7 +169,9 @@ class AudioCapture:
                             if (
                                 self.callback and chunk_count % 50 == 0
                             ):  # Process every 50th chunk (~3 seconds)
-                                audio_chunk = b"".join(list(self.mic_buffer)[-50:])
+                                audio_chunk = self.mic_buffer.latest(
+                                    self._transcription_samples
+                                )
                                 self.callback(
                                     audio_chunk,
                                     source="microphone",
@@ -158,7 +203,9 @@ class AudioCapture:
                             if (
                                 self.callback and chunk_count % 50 == 0
                             ):  # Process every 50th chunk (~3 seconds)
-                                audio_chunk = b"".join(list(self.system_buffer)[-50:])
+                                audio_chunk = self.system_buffer.latest(
+                                    self._transcription_samples
+                                )
                                 self.callback(
                                     audio_chunk, source="system", is_transcription=True
                                 )
@@ -276,7 +323,7 @@ class AudioCapture:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(self.audio.get_sample_size(self.format))
                 wf.setframerate(self.sample_rate)
-                wf.writeframes(b"".join(buffer))
+                wf.writeframes(buffer.getvalue())
         except Exception as e:
             print(f"Error saving audio file {filename}: {e}")
 
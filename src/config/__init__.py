@@ -1,5 +1,6 @@
 """Configuration module for Voice Mode Transcript application."""
 
+from .logging_setup import configure_logging
 from .settings import AppConfig, get_config
 
-__all__ = ["AppConfig", "get_config"]
+__all__ = ["AppConfig", "configure_logging", "get_config"]
@@ -0,0 +1,45 @@
+"""Logging setup for Voice Mode Transcript application."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+LOG_QUEUE_SIZE = 10000
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Route application logging through a background writer thread.
+
+    Callers only enqueue records onto a bounded queue; a single
+    ``QueueListener`` thread formats them and writes to stderr, so callback
+    threads never contend for the stream lock. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.addHandler(_DroppingQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -36,6 +36,7 @@ class AppConfig:
     llm_api_key: Optional[str] = None
     llm_base_url: str = "https://api.lambda.ai/v1"
     llm_model: str = "llama-4-maverick-17b-128e-instruct-fp8"
+    max_llm_inflight: int = 4  # queued + running LLM jobs before rejecting
 
     # Auto-processing settings
     auto_processing_enabled: bool = True
@@ -64,6 +65,9 @@ class AppConfig:
             llm_api_key=os.getenv("LLM_API_KEY"),
             llm_base_url=os.getenv("LLM_BASE_URL", cls.llm_base_url),
             llm_model=os.getenv("LLM_MODEL", cls.llm_model),
+            max_llm_inflight=int(
+                os.getenv("MAX_LLM_INFLIGHT", str(cls.max_llm_inflight))
+            ),
             auto_processing_enabled=os.getenv("AUTO_PROCESSING_ENABLED", "true").lower()
             == "true",
             auto_processing_interval_minutes=int(
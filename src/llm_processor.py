@@ -27,8 +27,11 @@ class LLMProcessor:
         Args:
             callback: Function to call when LLM processing completes
                      Signature: callback(result_data: Dict[str, Any])
+                     More subscribers can be added with register_callback()
         """
-        self.callback = callback
+        self._callbacks: list[Callable[[dict[str, Any]], None]] = []
+        if callback:
+            self.register_callback(callback)
 
         # Initialize OpenAI client for Lambda Labs
         self.client = OpenAI(
@@ -40,6 +43,9 @@ class LLMProcessor:
         # Processing state
         self.is_processing = False
         self.processing_queue: list[dict[str, Any]] = []
+        # Queued jobs by job_id, kept in step with processing_queue
+        self._jobs_by_id: dict[str, dict[str, Any]] = {}
+        self._queue_lock = threading.Lock()
 
         # Statistics
         self.total_processed = 0
@@ -48,6 +54,24 @@ class LLMProcessor:
 
         print(f"🤖 LLM Processor initialized with model: {self.model}")
 
+    def register_callback(self, callback: Callable[[dict[str, Any]], None]):
+        """
+        Subscribe to processing events
+
+        Callbacks receive every event and should ignore types they don't handle,
+        so one processor can be shared by several services.
+        """
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def _notify(self, event_data: dict[str, Any]):
+        """Send an event to all registered callbacks"""
+        for callback in self._callbacks:
+            try:
+                callback(event_data)
+            except Exception as e:
+                print(f"❌ Error in LLM processor callback: {e}")
+
     def process_transcripts_async(
         self, transcripts: list[dict[str, Any]], session_id: str
     ) -> str:
@@ -75,7 +99,9 @@ class LLMProcessor:
             "status": "queued",
         }
 
-        self.processing_queue.append(job_data)
+        with self._queue_lock:
+            self.processing_queue.append(job_data)
+            self._jobs_by_id[job_id] = job_data
 
         # Start processing in background thread
         processing_thread = threading.Thread(
@@ -186,8 +212,10 @@ class LLMProcessor:
 
             try:
                 # Get next job from queue
-                job_data = self.processing_queue.pop(0)
-                job_id = job_data["job_id"]
+                with self._queue_lock:
+                    job_data = self.processing_queue.pop(0)
+                    job_id = job_data["job_id"]
+                    self._jobs_by_id.pop(job_id, None)
                 transcripts = job_data["transcripts"]
                 session_id = job_data["session_id"]
 
@@ -195,42 +223,39 @@ class LLMProcessor:
                     f"🤖 Processing LLM job {job_id} with {len(transcripts)} transcripts"
                 )
 
-                # Notify callback of processing start
-                if self.callback:
-                    self.callback(
-                        {
-                            "type": "llm_processing_start",
-                            "job_id": job_id,
-                            "session_id": session_id,
-                            "transcript_count": len(transcripts),
-                        }
-                    )
+                # Notify callbacks of processing start
+                self._notify(
+                    {
+                        "type": "llm_processing_start",
+                        "job_id": job_id,
+                        "session_id": session_id,
+                        "transcript_count": len(transcripts),
+                    }
+                )
 
                 # Process transcripts
                 result = self.process_transcripts_sync(transcripts, session_id)
                 result["job_id"] = job_id
 
-                # Notify callback of completion
-                if self.callback:
-                    self.callback(
-                        {
-                            "type": "llm_processing_complete",
-                            "job_id": job_id,
-                            "result": result,
-                        }
-                    )
+                # Notify callbacks of completion
+                self._notify(
+                    {
+                        "type": "llm_processing_complete",
+                        "job_id": job_id,
+                        "result": result,
+                    }
+                )
 
             except Exception as e:
                 print(f"❌ Error in LLM queue worker: {e}")
 
-                if self.callback:
-                    self.callback(
-                        {
-                            "type": "llm_processing_error",
-                            "job_id": job_data.get("job_id", "unknown"),
-                            "error": str(e),
-                        }
-                    )
+                self._notify(
+                    {
+                        "type": "llm_processing_error",
+                        "job_id": job_data.get("job_id", "unknown"),
+                        "error": str(e),
+                    }
+                )
             finally:
                 self.is_processing = False
 
@@ -302,27 +327,40 @@ Do not include explanations, metadata, or timestamps in your output - only the s
             "total_processing_time": self.total_processing_time,
             "average_processing_time": avg_processing_time,
             "is_processing": self.is_processing,
-            "queue_length": len(self.processing_queue),
+            "queue_length": self.get_queue_length(),
             "model": self.model,
         }
 
     def clear_queue(self):
         """Clear the processing queue"""
-        self.processing_queue = []
+        with self._queue_lock:
+            self.processing_queue = []
+            self._jobs_by_id = {}
         print("🗑️  Cleared LLM processing queue")
 
+    @staticmethod
+    def _job_status(job: dict[str, Any]) -> dict[str, Any]:
+        """Summarize a queued job for status reporting"""
+        return {
+            "job_id": job["job_id"],
+            "session_id": job["session_id"],
+            "transcript_count": len(job["transcripts"]),
+            "timestamp": job["timestamp"],
+            "status": job["status"],
+        }
+
     def get_queue_status(self) -> list[dict[str, Any]]:
         """Get current queue status"""
-        return [
-            {
-                "job_id": job["job_id"],
-                "session_id": job["session_id"],
-                "transcript_count": len(job["transcripts"]),
-                "timestamp": job["timestamp"],
-                "status": job["status"],
-            }
-            for job in self.processing_queue
-        ]
+        return [self._job_status(job) for job in self.processing_queue]
+
+    def get_queue_length(self) -> int:
+        """Get the number of queued jobs"""
+        return len(self.processing_queue)
+
+    def get_job_status(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Get the status of a queued job, or None if it is not queued"""
+        job = self._jobs_by_id.get(job_id)
+        return self._job_status(job) if job is not None else None
 
     def generate_session_summary(
         self, processed_transcripts: list[dict[str, Any]], session_id: str
@@ -0,0 +1,122 @@
+"""Shared helpers for the database model dataclasses."""
+
+import sys
+from collections.abc import Sequence
+from dataclasses import MISSING, fields
+from typing import Any, Callable, ClassVar, Optional, TypeVar
+
+# Keyword arguments for ``@dataclass`` on row models. ``slots=True`` drops the
+# per-instance ``__dict__``, which matters when queries materialize thousands of
+# rows. It is only available on Python 3.10+, so older interpreters fall back to
+# regular dataclasses.
+DATACLASS_OPTIONS: dict = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+ModelT = TypeVar("ModelT", bound="RowModel")
+
+
+class RowModel:
+    """Base class for dataclasses that map to a database row."""
+
+    __slots__ = ()
+
+    # Field names in declaration order, filled in by ``row_model``
+    _FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_db_row(cls: type[ModelT], row: Sequence[Any]) -> ModelT:
+        """Create an instance from a database row.
+
+        Replaced by a generated reader on classes decorated with ``row_model``.
+        """
+        raise _no_reader(cls, row)
+
+    def to_dict(self) -> dict:
+        """Convert the model to a dictionary for JSON serialization."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+def _no_reader(cls: type, row: Sequence[Any]) -> ValueError:
+    """Build the error for a row no reader of ``cls`` accepts."""
+    return ValueError(f"{cls.__name__} has no reader for a row of {len(row)} columns")
+
+
+def _compile(source: str, name: str, namespace: dict[str, Any]) -> Any:
+    """Compile a generated function definition and return the function."""
+    exec(compile(source, f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def row_model(
+    cls: Optional[type[ModelT]] = None,
+    *,
+    converters: Optional[dict[str, Callable[[Any], Any]]] = None,
+) -> Any:
+    """Cache the field names of a row dataclass and generate its row mappers.
+
+    ``to_dict`` is generated as a single dict literal over the fields, which is
+    cheaper per call than looping over the cached names at runtime and cannot
+    drift out of sync with the dataclass definition.
+
+    ``from_db_row`` is generated as one specialized reader per supported row
+    length (all required fields up to all fields), each constructing the
+    instance positionally with no per-column branching. Trailing fields missing
+    from shorter rows keep their dataclass defaults, and extra trailing columns
+    (e.g. from ``SELECT *`` after a migration) are ignored. Rows missing a
+    required field raise ValueError. ``converters`` maps field names to
+    callables applied to the raw column value.
+
+    Can be used bare (``@row_model``) or with arguments
+    (``@row_model(converters={...})``).
+    """
+    if cls is None:
+        return lambda c: _build_row_model(c, converters or {})
+    return _build_row_model(cls, converters or {})
+
+
+def _build_row_model(
+    cls: type[ModelT], converters: dict[str, Callable[[Any], Any]]
+) -> type[ModelT]:
+    model_fields = fields(cls)  # type: ignore[arg-type]
+    names = tuple(f.name for f in model_fields)
+    unknown = set(converters) - set(names)
+    if unknown:
+        raise ValueError(f"Unknown fields for {cls.__name__}: {sorted(unknown)}")
+    cls._FIELDS = names
+
+    items = ", ".join(f"{name!r}: self.{name}" for name in names)
+    to_dict = _compile(f"def to_dict(self):\n    return {{{items}}}\n", "to_dict", {})
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = RowModel.to_dict.__doc__
+    cls.to_dict = to_dict  # type: ignore[method-assign]
+
+    required = sum(
+        1 for f in model_fields if f.default is MISSING and f.default_factory is MISSING
+    )
+    namespace: dict[str, Any] = {"cls": cls}
+    for name, converter in converters.items():
+        namespace[f"_convert_{name}"] = converter
+
+    readers = {}
+    for length in range(required, len(names) + 1):
+        args = ", ".join(
+            f"_convert_{name}(row[{index}])" if name in converters else f"row[{index}]"
+            for index, name in enumerate(names[:length])
+        )
+        readers[length] = _compile(
+            f"def read_row(row):\n    return cls({args})\n", "read_row", namespace
+        )
+
+    from_db_row = _compile(
+        "def from_db_row(cls, row):\n"
+        "    try:\n"
+        "        reader = readers[min(len(row), n)]\n"
+        "    except KeyError:\n"
+        "        raise _no_reader(cls, row) from None\n"
+        "    return reader(row)\n",
+        "from_db_row",
+        {"readers": readers, "n": len(names), "_no_reader": _no_reader},
+    )
+    from_db_row.__qualname__ = f"{cls.__qualname__}.from_db_row"
+    from_db_row.__doc__ = f"Create {cls.__name__} instance from database row."
+    cls.from_db_row = classmethod(from_db_row)  # type: ignore[method-assign, assignment]
+    return cls
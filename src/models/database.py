@@ -127,3 +127,8 @@ def init_database() -> None:
 
         conn.commit()
         print("✅ Database initialized successfully")
+
+    # Tables may have been created or altered; re-read the sessions columns
+    from .repositories import SessionRepository
+
+    SessionRepository.invalidate_session_columns()
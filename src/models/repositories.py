@@ -1,16 +1,68 @@
 """Repository classes for database operations."""
 
 import json
-from typing import Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import ClassVar, Optional
 
 from .database import get_db_connection
 from .session import Session
 from .transcript import ProcessedTranscript, RawTranscript
 
+_INSERT_RAW_TRANSCRIPT_SQL = """
+    INSERT INTO raw_transcripts
+    (id, session_id, text, timestamp, sequence_number, confidence, processing_time, audio_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _raw_transcript_params(transcript: RawTranscript) -> tuple:
+    """Build the INSERT parameters for a raw transcript."""
+    return (
+        transcript.id,
+        transcript.session_id,
+        transcript.text,
+        transcript.timestamp,
+        transcript.sequence_number,
+        transcript.confidence,
+        transcript.processing_time,
+        transcript.audio_source,
+    )
+
+
+_INSERT_PROCESSED_TRANSCRIPT_SQL = """
+    INSERT INTO processed_transcripts
+    (id, session_id, processed_text, original_transcript_ids,
+     original_transcript_count, llm_model, processing_time, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _processed_transcript_params(transcript: ProcessedTranscript) -> tuple:
+    """Build the INSERT parameters for a processed transcript."""
+    return (
+        transcript.id,
+        transcript.session_id,
+        transcript.processed_text,
+        # Transcript IDs are stored as a JSON string
+        json.dumps(transcript.original_transcript_ids),
+        transcript.original_transcript_count,
+        transcript.llm_model,
+        transcript.processing_time,
+        transcript.timestamp,
+    )
+
 
 class SessionRepository:
     """Repository for session database operations."""
 
+    # Session fields the sessions table provides, resolved on first lookup
+    # and reset by invalidate_session_columns() when migrations run
+    _session_columns: ClassVar[Optional[tuple[str, ...]]] = None
+    _session_columns_lock = threading.Lock()
+
     def create(self, session_id: str, start_time: str) -> bool:
         """Create a new session record."""
         try:
@@ -118,47 +170,51 @@ class SessionRepository:
     def get_by_id(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT id, start_time, end_time, duration, total_segments,
-                       total_words, avg_confidence, confidence_count, confidence_sum,
-                       bookmarked, summary, keywords, summary_generated_at
-                FROM sessions WHERE id = ?
-            """,
+            columns = self._get_session_columns(conn)
+            row = conn.execute(
+                f"SELECT {', '.join(columns)} FROM sessions WHERE id = ?",
                 (session_id,),
-            )
-
-            row = cursor.fetchone()
-            if row:
-                # Create Session from get_by_id row format
-                keywords = []
-                if len(row) > 11 and row[11]:
-                    try:
-                        import json
-
-                        keywords = json.loads(row[11])
-                    except (json.JSONDecodeError, TypeError):
-                        keywords = []
-
-                return Session(
-                    id=row[0],
-                    start_time=row[1],
-                    end_time=row[2],
-                    duration=row[3],
-                    total_segments=row[4],
-                    raw_transcript_count=0,  # Not available in this query
-                    processed_transcript_count=0,  # Not available in this query
-                    total_words=row[5],
-                    avg_confidence=row[6],
-                    confidence_count=row[7],
-                    confidence_sum=row[8],
-                    bookmarked=bool(row[9]) if len(row) > 9 else False,
-                    summary=row[10] if len(row) > 10 else None,
-                    keywords=keywords,
-                    summary_generated_at=row[12] if len(row) > 12 else None,
-                )
-            return None
+            ).fetchone()
+            if not row:
+                return None
+            session = Session.from_db_row(row)
+            if session.keywords is None:
+                session.keywords = []
+            return session
+
+    @classmethod
+    def _get_session_columns(cls, conn: sqlite3.Connection) -> tuple[str, ...]:
+        """Resolve which Session fields the sessions table provides.
+
+        Older databases predate the bookmark and summary migrations, so the
+        longest prefix of Session fields present in the table is selected.
+        Session.from_db_row then picks its reader for that row length instead
+        of branching on every row. The schema is inspected once per process;
+        code that alters the sessions table calls invalidate_session_columns.
+        """
+        columns = cls._session_columns
+        if columns is not None:
+            return columns
+
+        with cls._session_columns_lock:
+            columns = cls._session_columns
+            if columns is None:
+                existing = {
+                    row[1] for row in conn.execute("PRAGMA table_info(sessions)")
+                }
+                names = []
+                for name in Session._FIELDS:
+                    if name not in existing:
+                        break
+                    names.append(name)
+                columns = cls._session_columns = tuple(names)
+        return columns
+
+    @classmethod
+    def invalidate_session_columns(cls) -> None:
+        """Forget the resolved sessions columns (call after a migration)."""
+        with cls._session_columns_lock:
+            cls._session_columns = None
 
     def update_metrics(
         self,
@@ -224,8 +280,6 @@ class SessionRepository:
     ) -> bool:
         """Update session with summary and keywords."""
         try:
-            import json
-
             with get_db_connection() as conn:
                 cursor = conn.cursor()
 
@@ -256,21 +310,7 @@ class RawTranscriptRepository:
             with get_db_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                    INSERT INTO raw_transcripts
-                    (id, session_id, text, timestamp, sequence_number, confidence, processing_time, audio_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        transcript.id,
-                        transcript.session_id,
-                        transcript.text,
-                        transcript.timestamp,
-                        transcript.sequence_number,
-                        transcript.confidence,
-                        transcript.processing_time,
-                        transcript.audio_source,
-                    ),
+                    _INSERT_RAW_TRANSCRIPT_SQL, _raw_transcript_params(transcript)
                 )
                 conn.commit()
                 return True
@@ -278,11 +318,52 @@ class RawTranscriptRepository:
             print(f"❌ Error saving raw transcript: {e}")
             return False
 
+    def create_many(
+        self, transcripts: Iterable[RawTranscript], bulk: bool = False
+    ) -> bool:
+        """Save many raw transcripts in a single transaction.
+
+        With ``bulk=True`` (offline imports and replays only), durability is
+        relaxed for the duration of the import: ``synchronous=OFF`` and an
+        in-memory rollback journal skip the per-page fsyncs that dominate
+        SQLite write latency. The previous journal mode is restored afterwards.
+        """
+        try:
+            with get_db_connection() as conn:
+                previous_journal_mode = None
+                if bulk:
+                    previous_journal_mode = conn.execute(
+                        "PRAGMA journal_mode"
+                    ).fetchone()[0]
+                    conn.execute("PRAGMA synchronous = OFF")
+                    conn.execute("PRAGMA journal_mode = MEMORY")
+
+                try:
+                    conn.executemany(
+                        _INSERT_RAW_TRANSCRIPT_SQL,
+                        (_raw_transcript_params(t) for t in transcripts),
+                    )
+                    conn.commit()
+                finally:
+                    if previous_journal_mode:
+                        conn.execute(f"PRAGMA journal_mode = {previous_journal_mode}")
+                return True
+        except Exception as e:
+            print(f"❌ Error saving raw transcripts: {e}")
+            return False
+
     def get_by_session(self, session_id: str) -> list[RawTranscript]:
         """Get all raw transcripts for a session."""
+        return list(self.iter_by_session(session_id))
+
+    def iter_by_session(self, session_id: str) -> Iterator[RawTranscript]:
+        """Yield raw transcripts for a session one row at a time.
+
+        The connection stays open until the iterator is exhausted or closed,
+        so callers that only serialize rows never hold the full result set.
+        """
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            cursor = conn.execute(
                 """
                 SELECT id, session_id, text, timestamp, sequence_number, confidence, processing_time, audio_source
                 FROM raw_transcripts
@@ -292,7 +373,29 @@ class RawTranscriptRepository:
                 (session_id,),
             )
 
-            return [RawTranscript.from_db_row(row) for row in cursor.fetchall()]
+            for row in cursor:
+                yield RawTranscript.from_db_row(row)
+
+    def iter_dicts_by_session(self, session_id: str) -> Iterator[dict]:
+        """Yield a session's raw transcripts as dicts, one row at a time.
+
+        Equivalent to ``t.to_dict()`` over ``iter_by_session`` without
+        building a RawTranscript per row first.
+        """
+        names = RawTranscript._FIELDS
+        with get_db_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT {", ".join(names)}
+                FROM raw_transcripts
+                WHERE session_id = ?
+                ORDER BY sequence_number
+            """,
+                (session_id,),
+            )
+
+            for row in cursor:
+                yield dict(zip(names, row))
 
     def get_paginated(
         self, page: int = 1, limit: int = 50
@@ -325,32 +428,24 @@ class RawTranscriptRepository:
 class ProcessedTranscriptRepository:
     """Repository for processed transcript database operations."""
 
+    # Recent get_by_session results, shared by all instances and keyed by
+    # session ID. Each entry records the session's (row count, max rowid) when
+    # it was read; processed transcripts are insert-only, so an unchanged pair
+    # means the rows are unchanged, whichever code path wrote them.
+    _SESSION_CACHE_SIZE = 32
+    _session_cache: "OrderedDict[str, tuple[tuple, list[ProcessedTranscript]]]" = (
+        OrderedDict()
+    )
+    _session_cache_lock = threading.Lock()
+
     def create(self, transcript: ProcessedTranscript) -> bool:
         """Save a processed transcript to the database."""
         try:
             with get_db_connection() as conn:
                 cursor = conn.cursor()
-
-                # Convert transcript IDs list to JSON string
-                transcript_ids_json = json.dumps(transcript.original_transcript_ids)
-
                 cursor.execute(
-                    """
-                    INSERT INTO processed_transcripts
-                    (id, session_id, processed_text, original_transcript_ids,
-                     original_transcript_count, llm_model, processing_time, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        transcript.id,
-                        transcript.session_id,
-                        transcript.processed_text,
-                        transcript_ids_json,
-                        transcript.original_transcript_count,
-                        transcript.llm_model,
-                        transcript.processing_time,
-                        transcript.timestamp,
-                    ),
+                    _INSERT_PROCESSED_TRANSCRIPT_SQL,
+                    _processed_transcript_params(transcript),
                 )
                 conn.commit()
                 return True
@@ -358,11 +453,45 @@ class ProcessedTranscriptRepository:
             print(f"❌ Error saving processed transcript: {e}")
             return False
 
+    def create_many(self, transcripts: Iterable[ProcessedTranscript]) -> bool:
+        """Save many processed transcripts in a single transaction."""
+        try:
+            with get_db_connection() as conn:
+                conn.executemany(
+                    _INSERT_PROCESSED_TRANSCRIPT_SQL,
+                    (_processed_transcript_params(t) for t in transcripts),
+                )
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"❌ Error saving processed transcripts: {e}")
+            return False
+
     def get_by_session(self, session_id: str) -> list[ProcessedTranscript]:
-        """Get all processed transcripts for a session."""
+        """Get all processed transcripts for a session.
+
+        Repeated reads of an unchanged session (UI polling) are served from
+        the cache after one indexed COUNT/MAX query, skipping the row fetch
+        and model construction.
+        """
+        cache = self._session_cache
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            version = conn.execute(
+                """
+                SELECT COUNT(*), MAX(rowid)
+                FROM processed_transcripts
+                WHERE session_id = ?
+            """,
+                (session_id,),
+            ).fetchone()
+
+            with self._session_cache_lock:
+                cached = cache.get(session_id)
+                if cached is not None and cached[0] == version:
+                    cache.move_to_end(session_id)
+                    return list(cached[1])
+
+            cursor = conn.execute(
                 """
                 SELECT id, session_id, processed_text, original_transcript_ids,
                        original_transcript_count, llm_model, processing_time, timestamp
@@ -372,8 +501,33 @@ class ProcessedTranscriptRepository:
             """,
                 (session_id,),
             )
-
-            return [ProcessedTranscript.from_db_row(row) for row in cursor.fetchall()]
+            transcripts = [ProcessedTranscript.from_db_row(row) for row in cursor]
+
+        # A row inserted between the two queries leaves the entry stamped with
+        # the older version, so the next read refetches rather than going stale
+        with self._session_cache_lock:
+            cache[session_id] = (version, transcripts)
+            cache.move_to_end(session_id)
+            if len(cache) > self._SESSION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return list(transcripts)
+
+    def get_summary_fields(self, session_id: str) -> list[tuple[str, str, str, int]]:
+        """Get the fields session summaries need for a session's processed transcripts.
+
+        Returns (processed_text, timestamp, llm_model, original_transcript_count)
+        tuples, skipping the other columns and model construction.
+        """
+        with get_db_connection() as conn:
+            return conn.execute(
+                """
+                SELECT processed_text, timestamp, llm_model, original_transcript_count
+                FROM processed_transcripts
+                WHERE session_id = ?
+                ORDER BY timestamp
+            """,
+                (session_id,),
+            ).fetchall()
 
     def get_paginated(
         self, page: int = 1, limit: int = 20
@@ -4,9 +4,21 @@ import json
 from dataclasses import dataclass
 from typing import Optional
 
+from .base import DATACLASS_OPTIONS, RowModel, row_model
 
-@dataclass
-class RawTranscript:
+
+def _load_transcript_ids(value: Optional[str]) -> list[str]:
+    """Parse the JSON list of original transcript IDs stored in the database."""
+    return json.loads(value) if value else []
+
+
+# Not frozen: one RawTranscript is built per whisper callback, and a frozen
+# dataclass __init__ goes through object.__setattr__ for every field (about
+# 2.5x slower to construct). Field order must match the table columns for
+# from_db_row.
+@row_model
+@dataclass(**DATACLASS_OPTIONS)
+class RawTranscript(RowModel):
     """Represents a raw transcript from whisper.cpp."""
 
     id: str
@@ -18,36 +30,10 @@ class RawTranscript:
     processing_time: Optional[float] = None
     audio_source: str = "unknown"
 
-    @classmethod
-    def from_db_row(cls, row: tuple) -> "RawTranscript":
-        """Create RawTranscript instance from database row."""
-        return cls(
-            id=row[0],
-            session_id=row[1],
-            text=row[2],
-            timestamp=row[3],
-            sequence_number=row[4],
-            confidence=row[5],
-            processing_time=row[6],
-            audio_source=row[7] if len(row) > 7 else "unknown",
-        )
-
-    def to_dict(self) -> dict:
-        """Convert transcript to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "text": self.text,
-            "timestamp": self.timestamp,
-            "sequence_number": self.sequence_number,
-            "confidence": self.confidence,
-            "processing_time": self.processing_time,
-            "audio_source": self.audio_source,
-        }
-
 
-@dataclass
-class ProcessedTranscript:
+@row_model(converters={"original_transcript_ids": _load_transcript_ids})
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ProcessedTranscript(RowModel):
     """Represents a processed transcript from LLM."""
 
     id: str
@@ -59,39 +45,10 @@ class ProcessedTranscript:
     processing_time: float
     timestamp: str
 
-    @classmethod
-    def from_db_row(cls, row: tuple) -> "ProcessedTranscript":
-        """Create ProcessedTranscript instance from database row."""
-        # Parse JSON string back to list
-        original_ids = json.loads(row[3]) if row[3] else []
 
-        return cls(
-            id=row[0],
-            session_id=row[1],
-            processed_text=row[2],
-            original_transcript_ids=original_ids,
-            original_transcript_count=row[4],
-            llm_model=row[5],
-            processing_time=row[6],
-            timestamp=row[7],
-        )
-
-    def to_dict(self) -> dict:
-        """Convert transcript to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "processed_text": self.processed_text,
-            "original_transcript_ids": self.original_transcript_ids,
-            "original_transcript_count": self.original_transcript_count,
-            "llm_model": self.llm_model,
-            "processing_time": self.processing_time,
-            "timestamp": self.timestamp,
-        }
-
-
-@dataclass
-class LegacyTranscript:
+@row_model(converters={"is_final": bool})
+@dataclass(**DATACLASS_OPTIONS)
+class LegacyTranscript(RowModel):
     """Represents a legacy transcript (for backward compatibility)."""
 
     id: int
@@ -101,28 +58,3 @@ class LegacyTranscript:
     text: str
     confidence: Optional[float] = None
     is_final: bool = False
-
-    @classmethod
-    def from_db_row(cls, row: tuple) -> "LegacyTranscript":
-        """Create LegacyTranscript instance from database row."""
-        return cls(
-            id=row[0],
-            session_id=row[1],
-            timestamp=row[2],
-            source=row[3],
-            text=row[4],
-            confidence=row[5],
-            is_final=bool(row[6]),
-        )
-
-    def to_dict(self) -> dict:
-        """Convert transcript to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "timestamp": self.timestamp,
-            "source": self.source,
-            "text": self.text,
-            "confidence": self.confidence,
-            "is_final": self.is_final,
-        }
@@ -46,12 +46,13 @@ class MultiSourceWhisperManager:
 
     def remove_audio_source(self, source_name: str):
         """Remove an audio source"""
-        if source_name in self.processors:
-            processor = self.processors[source_name]
-            if processor.is_running:
-                processor.stop_streaming()
-            del self.processors[source_name]
-            print(f"🗑️  Removed audio source: {source_name}")
+        processor = self.processors.pop(source_name, None)
+        if processor is None:
+            return
+
+        if processor.is_running:
+            processor.stop_streaming()
+        print(f"🗑️  Removed audio source: {source_name}")
 
     def start_streaming(self, session_id: str) -> bool:
         """
@@ -123,10 +124,8 @@ class MultiSourceWhisperManager:
             Dict or List of transcripts
         """
         if source_name:
-            if source_name in self.processors:
-                return self.processors[source_name].get_accumulated_transcripts()
-            else:
-                return []
+            processor = self.processors.get(source_name)
+            return processor.get_accumulated_transcripts() if processor else []
         else:
             # Return transcripts from all sources, sorted by timestamp
             all_transcripts = []
@@ -150,19 +149,21 @@ class MultiSourceWhisperManager:
     def get_stats(self) -> dict[str, Any]:
         """Get statistics from all audio sources"""
         sources_stats: dict[str, Any] = {}
+        active_sources = 0
 
+        # Single pass; snapshot each processor's running flag once
         for source_name, processor in self.processors.items():
+            is_running = processor.is_running
+            active_sources += is_running
             sources_stats[source_name] = {
-                "is_running": processor.is_running,
+                "is_running": is_running,
                 "transcript_count": len(processor.accumulated_transcripts),
                 "audio_source": processor.audio_source,
                 "audio_device_id": processor.audio_device_id,
             }
 
-        stats = {
-            "total_sources": len(self.processors),
-            "active_sources": sum(1 for p in self.processors.values() if p.is_running),
+        return {
+            "total_sources": len(sources_stats),
+            "active_sources": active_sources,
             "sources": sources_stats,
         }
-
-        return stats
@@ -4,31 +4,226 @@ SDL Device Mapper
 Maps between PyAudio devices (for audio level monitoring) and SDL devices (for whisper.cpp)
 """
 
+import ctypes
+import ctypes.util
+import difflib
+import functools
 import os
 import re
+import select
 import subprocess
-from typing import Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import pyaudio
 
+# Seconds a device enumeration stays valid. Enumerating SDL devices spawns
+# whisper-stream for several seconds, and every device lookup used to do it.
+DEVICE_CACHE_TTL = float(os.getenv("SDL_DEVICE_CACHE_TTL", "30"))
+
+# whisper-stream prints its capture devices in one burst after loading the
+# model; stop reading once output has been quiet this long after the burst.
+SDL_ENUM_IDLE_TIMEOUT = 0.2
+# Upper bound on a single enumeration (the previous fixed wait)
+SDL_ENUM_MAX_WAIT = 3.0
+
+# Seconds a stat() of the whisper-stream binary or model is trusted
+FILE_STAT_TTL = 60.0
+
+# Minimum difflib similarity for fuzzy device name matches
+NAME_MATCH_CUTOFF = 0.9
+
+SDL_INIT_AUDIO = 0x00000010
+
+# Where to look for libSDL2 when ctypes.util.find_library can't find it (e.g.
+# Homebrew prefixes, which aren't on the default macOS search path)
+_SDL2_FALLBACK_PATHS = (
+    "/opt/homebrew/lib/libSDL2.dylib",
+    "/usr/local/lib/libSDL2.dylib",
+    "libSDL2-2.0.so.0",
+)
+
+# Common device name prefixes ignored when matching SDL and PyAudio names
+_STRIP_RE = re.compile(r"\?\?\?'s |built-in |external ")
+
+# Matched against raw output bytes; only the device name is decoded
+_SDL_DEVICE_RE = re.compile(rb"Capture device #(\d+): '([^']+)'")
+
+
+@functools.cache
+def _load_sdl2() -> Optional[ctypes.CDLL]:
+    """Load libSDL2 for device enumeration, or None if it isn't available"""
+    found = ctypes.util.find_library("SDL2")
+    for path in ((found,) if found else ()) + _SDL2_FALLBACK_PATHS:
+        try:
+            sdl = ctypes.CDLL(path)
+        except OSError:
+            continue
+
+        sdl.SDL_SetHint.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        sdl.SDL_InitSubSystem.argtypes = [ctypes.c_uint32]
+        sdl.SDL_QuitSubSystem.argtypes = [ctypes.c_uint32]
+        sdl.SDL_GetNumAudioDevices.argtypes = [ctypes.c_int]
+        sdl.SDL_GetAudioDeviceName.argtypes = [ctypes.c_int, ctypes.c_int]
+        sdl.SDL_GetAudioDeviceName.restype = ctypes.c_char_p
+
+        # Keep SDL from installing SIGINT/SIGTERM handlers in our process
+        sdl.SDL_SetHint(b"SDL_NO_SIGNAL_HANDLERS", b"1")
+        return sdl
+    return None
+
 
 class SDLDeviceMapper:
-    def __init__(self):
+    # Enumeration results are shared by all instances, since callers (including
+    # the Flask routes) create a fresh mapper per request.
+    _cache: dict[tuple, tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
+    _load_locks: dict[tuple, threading.Lock] = {}
+    cache_hits = 0
+    cache_misses = 0
+    # path -> (checked_at, mtime or None if missing)
+    _stat_cache: dict[str, tuple[float, Optional[float]]] = {}
+    # (binary, mtime) -> whether libSDL2 lists the same capture devices as
+    # that whisper-stream build
+    _native_verified: dict[tuple, bool] = {}
+
+    def __init__(self, cache_ttl: float = DEVICE_CACHE_TTL):
         self.stream_binary = os.getenv(
             "WHISPER_STREAM_BINARY", "./whisper.cpp/build/bin/whisper-stream"
         )
         self.model_path = os.getenv(
             "WHISPER_MODEL_PATH", "./whisper.cpp/models/ggml-base.en.bin"
         )
+        self.cache_ttl = cache_ttl
+
+    @classmethod
+    def invalidate(cls):
+        """Drop cached device enumerations (e.g. on an explicit refresh)"""
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._stat_cache.clear()
+            cls._native_verified.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, int]:
+        """Get device cache hit/miss counters"""
+        return {"cache_hits": cls.cache_hits, "cache_misses": cls.cache_misses}
+
+    def _cached(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """Return a cached value for key, calling loader when missing or stale.
+
+        Concurrent callers for the same key wait for the in-flight load instead
+        of spawning a second enumeration.
+        """
+        cls = SDLDeviceMapper
+        with cls._cache_lock:
+            load_lock = cls._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with cls._cache_lock:
+                entry = cls._cache.get(key)
+                if entry and time.monotonic() - entry[0] < self.cache_ttl:
+                    cls.cache_hits += 1
+                    return entry[1]
+                cls.cache_misses += 1
+
+            value = loader()
+            with cls._cache_lock:
+                cls._cache[key] = (time.monotonic(), value)
+            return value
+
+    def _sdl_cache_key(self) -> tuple:
+        """Cache key for SDL devices; changes when the binary or model changes"""
+        return ("sdl", self.stream_binary, self.model_path) + tuple(
+            self._mtime(path) for path in (self.stream_binary, self.model_path)
+        )
+
+    @classmethod
+    def _mtime(cls, path: str) -> Optional[float]:
+        """Get a file's mtime (None if missing), re-checking every FILE_STAT_TTL"""
+        now = time.monotonic()
+        entry = cls._stat_cache.get(path)
+        if entry and now - entry[0] < FILE_STAT_TTL:
+            return entry[1]
+
+        try:
+            mtime: Optional[float] = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        cls._stat_cache[path] = (now, mtime)
+        return mtime
 
     def get_sdl_devices(self) -> list[tuple[int, str]]:
-        """Get SDL device list from whisper.cpp"""
+        """Get SDL device list from whisper.cpp (cached)"""
+        return self._cached(self._sdl_cache_key(), self._enumerate_sdl_devices)
+
+    def _enumerate_sdl_devices(self) -> list[tuple[int, str]]:
+        """Enumerate SDL devices, preferring libSDL2 over running whisper-stream
+
+        The libSDL2 we load may not be the one whisper-stream links, so its
+        device indices are only trusted after matching one whisper-stream
+        listing for the current binary.
+        """
+        cls = SDLDeviceMapper
+        devices = self._enumerate_sdl_devices_native()
+        if not devices:
+            return self._enumerate_sdl_devices_subprocess()
+
+        build = (self.stream_binary, self._mtime(self.stream_binary))
+        with cls._cache_lock:
+            verified = cls._native_verified.get(build)
+        if verified:
+            return devices
+
+        listing = self._enumerate_sdl_devices_subprocess()
+        if verified is None and listing:
+            verified = listing == devices
+            with cls._cache_lock:
+                cls._native_verified[build] = verified
+            if not verified:
+                print(
+                    "⚠️ libSDL2 devices differ from whisper-stream's, "
+                    "using whisper-stream for device enumeration"
+                )
+        return listing
+
+    def _enumerate_sdl_devices_native(self) -> Optional[list[tuple[int, str]]]:
+        """Enumerate SDL capture devices by calling libSDL2 directly
+
+        Returns None if SDL2 can't be loaded or initialized. Device indices match
+        the "Capture device #" IDs whisper-stream prints only for the same SDL
+        build; _enumerate_sdl_devices checks that before using them.
+        """
+        sdl = _load_sdl2()
+        if sdl is None:
+            return None
+
+        try:
+            if sdl.SDL_InitSubSystem(SDL_INIT_AUDIO) != 0:
+                return None
+            try:
+                sdl_devices = []
+                for i in range(max(sdl.SDL_GetNumAudioDevices(1), 0)):
+                    name = sdl.SDL_GetAudioDeviceName(i, 1)
+                    if name:
+                        sdl_devices.append((i, name.decode("utf-8", errors="replace")))
+                return sdl_devices
+            finally:
+                sdl.SDL_QuitSubSystem(SDL_INIT_AUDIO)
+        except Exception as e:
+            print(f"⚠️ SDL2 device enumeration failed, using whisper-stream: {e}")
+            return None
 
-        if not os.path.exists(self.stream_binary):
+    def _enumerate_sdl_devices_subprocess(self) -> list[tuple[int, str]]:
+        """Enumerate SDL devices by briefly running whisper-stream"""
+
+        if self._mtime(self.stream_binary) is None:
             print(f"❌ whisper-stream not found at {self.stream_binary}")
             return []
 
-        if not os.path.exists(self.model_path):
+        if self._mtime(self.model_path) is None:
             print(f"❌ Model not found at {self.model_path}")
             return []
 
@@ -49,48 +244,82 @@ class SDLDeviceMapper:
 
         try:
             process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
             )
 
-            # Let it initialize and capture device enumeration
-            import time
-
-            time.sleep(3)
-            process.terminate()
-
-            output, _ = process.communicate(timeout=5)
-
-            # Parse SDL devices
-            sdl_devices = []
-            for line in output.split("\n"):
-                if "Capture device #" in line:
-                    match = re.search(r"Capture device #(\d+): \'([^\']+)\'", line)
-                    if match:
-                        device_id = int(match.group(1))
-                        device_name = match.group(2)
-                        sdl_devices.append((device_id, device_name))
+            # Read output as it arrives and stop once the device list has been
+            # printed and the output goes quiet. Raw os.read() keeps select()
+            # accurate, since a buffered reader could hold lines select can't see.
+            sdl_devices: list[tuple[int, str]] = []
+            pending = b""
+            fd = process.stdout.fileno()
+            deadline = time.monotonic() + SDL_ENUM_MAX_WAIT
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    ready, _, _ = select.select(
+                        [fd], [], [], min(SDL_ENUM_IDLE_TIMEOUT, remaining)
+                    )
+                    if not ready:
+                        if sdl_devices:
+                            break
+                        continue
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    self._parse_sdl_lines(lines, sdl_devices)
+            finally:
+                process.terminate()
+                try:
+                    output, _ = process.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    # whisper-stream ignored SIGTERM; don't leave it running
+                    process.kill()
+                    output, _ = process.communicate()
 
+            self._parse_sdl_lines((pending + output).split(b"\n"), sdl_devices)
             return sdl_devices
 
         except Exception as e:
             print(f"❌ Error getting SDL devices: {e}")
             return []
 
+    @staticmethod
+    def _parse_sdl_lines(lines: list[bytes], sdl_devices: list[tuple[int, str]]):
+        """Append SDL capture devices found in whisper-stream output lines"""
+        for line in lines:
+            match = _SDL_DEVICE_RE.search(line)
+            if match:
+                device_id = int(match.group(1))
+                device_name = match.group(2).decode("utf-8", errors="replace")
+                sdl_devices.append((device_id, device_name))
+
     def get_pyaudio_devices(self) -> list[tuple[int, str]]:
-        """Get PyAudio device list for audio level monitoring"""
+        """Get PyAudio device list for audio level monitoring (cached)"""
+        return self._cached(("pyaudio",), self._enumerate_pyaudio_devices)
+
+    def _enumerate_pyaudio_devices(self) -> list[tuple[int, str]]:
+        """Enumerate PyAudio input devices"""
         try:
+            # A PortAudio instance never sees devices added after it started,
+            # so each enumeration uses a fresh one. The TTL cache keeps this
+            # slow init/teardown off the warm path.
             audio = pyaudio.PyAudio()
+            try:
+                pyaudio_devices = []
+                for i in range(audio.get_device_count()):
+                    try:
+                        device_info = audio.get_device_info_by_index(i)
+                        if device_info["maxInputChannels"] > 0:
+                            pyaudio_devices.append((i, device_info["name"]))
+                    except Exception:
+                        pass
+            finally:
+                audio.terminate()
 
-            pyaudio_devices = []
-            for i in range(audio.get_device_count()):
-                try:
-                    device_info = audio.get_device_info_by_index(i)
-                    if device_info["maxInputChannels"] > 0:
-                        pyaudio_devices.append((i, device_info["name"]))
-                except Exception:
-                    pass
-
-            audio.terminate()
             return pyaudio_devices
 
         except Exception as e:
@@ -98,71 +327,112 @@ class SDLDeviceMapper:
             return []
 
     def create_device_mapping(self) -> dict[str, Any]:
-        """Create mapping between SDL and PyAudio devices"""
-        sdl_devices = self.get_sdl_devices()
-        pyaudio_devices = self.get_pyaudio_devices()
+        """Create mapping between SDL and PyAudio devices (cached)
+
+        The returned mapping is shared with other callers and must not be
+        mutated.
+        """
+        key = ("mapping",) + self._sdl_cache_key()
+        return self._cached(key, self._build_device_mapping)
+
+    def _build_device_mapping(self) -> dict[str, Any]:
+        """Build the SDL/PyAudio mapping from fresh device lists"""
+        # SDL and PyAudio enumeration touch independent subsystems
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sdl_future = executor.submit(self.get_sdl_devices)
+            pyaudio_future = executor.submit(self.get_pyaudio_devices)
+            sdl_devices = sdl_future.result()
+            pyaudio_devices = pyaudio_future.result()
 
         mapping: dict[str, Any] = {
             "sdl_devices": sdl_devices,
             "pyaudio_devices": pyaudio_devices,
             "sdl_to_pyaudio": {},
             "pyaudio_to_sdl": {},
+            # First BlackHole device, the default for system audio capture
+            "blackhole_sdl_id": next(
+                (
+                    sdl_id
+                    for sdl_id, sdl_name in sdl_devices
+                    if "blackhole" in sdl_name.lower()
+                ),
+                None,
+            ),
         }
 
+        # Index PyAudio devices by normalized name once (first device wins, as
+        # with the old in-order scan) so each SDL device is a hash lookup
+        pa_by_name: dict[str, int] = {}
+        for pa_id, pa_name in pyaudio_devices:
+            pa_by_name.setdefault(self._normalize_name(pa_name), pa_id)
+
         # Create name-based mapping
         for sdl_id, sdl_name in sdl_devices:
-            # Find matching PyAudio device by name
-            for pa_id, pa_name in pyaudio_devices:
-                if self._names_match(sdl_name, pa_name):
-                    mapping["sdl_to_pyaudio"][sdl_id] = pa_id
-                    mapping["pyaudio_to_sdl"][pa_id] = sdl_id
-                    break
+            pa_id = self._match_pyaudio_id(self._normalize_name(sdl_name), pa_by_name)
+            if pa_id is not None:
+                mapping["sdl_to_pyaudio"][sdl_id] = pa_id
+                mapping["pyaudio_to_sdl"][pa_id] = sdl_id
 
         return mapping
 
-    def _names_match(self, sdl_name: str, pyaudio_name: str) -> bool:
-        """Check if SDL and PyAudio device names refer to the same device"""
-        # Normalize names for comparison
-        sdl_norm = sdl_name.lower().strip()
-        pa_norm = pyaudio_name.lower().strip()
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """Normalize a device name for matching"""
+        # Remove common prefixes/suffixes
+        return _STRIP_RE.sub("", name.lower().strip())
 
+    @staticmethod
+    def _match_pyaudio_id(sdl_norm: str, pa_by_name: dict[str, int]) -> Optional[int]:
+        """Find the PyAudio device ID for a normalized SDL device name"""
         # Direct match
-        if sdl_norm == pa_norm:
-            return True
+        pa_id = pa_by_name.get(sdl_norm)
+        if pa_id is not None:
+            return pa_id
 
         # Partial match (one contains the other)
-        if sdl_norm in pa_norm or pa_norm in sdl_norm:
-            return True
-
-        # Handle common variations
-        # Remove common prefixes/suffixes
-        for prefix in ["???'s ", "built-in ", "external "]:
-            sdl_norm = sdl_norm.replace(prefix.lower(), "")
-            pa_norm = pa_norm.replace(prefix.lower(), "")
-
-        return sdl_norm == pa_norm
+        for pa_norm, pa_id in pa_by_name.items():
+            if sdl_norm in pa_norm or pa_norm in sdl_norm:
+                return pa_id
+
+        # Near-miss spellings (e.g. a trailing plural). The cutoff is kept high
+        # so numbered variants like "blackhole 2ch"/"blackhole 16ch" don't match.
+        close = difflib.get_close_matches(
+            sdl_norm, pa_by_name, n=1, cutoff=NAME_MATCH_CUTOFF
+        )
+        return pa_by_name[close[0]] if close else None
 
-    def get_sdl_device_id(self, pyaudio_device_id: Optional[int]) -> Optional[int]:
+    def get_sdl_device_id(
+        self, pyaudio_device_id: Optional[int], mapping: Optional[dict] = None
+    ) -> Optional[int]:
         """Convert PyAudio device ID to SDL device ID"""
         if pyaudio_device_id is None:
             return None
 
-        mapping = self.create_device_mapping()
+        if mapping is None:
+            mapping = self.create_device_mapping()
         result = mapping["pyaudio_to_sdl"].get(pyaudio_device_id)
         return result if isinstance(result, int) else None
 
-    def get_pyaudio_device_id(self, sdl_device_id: Optional[int]) -> Optional[int]:
+    def get_pyaudio_device_id(
+        self, sdl_device_id: Optional[int], mapping: Optional[dict] = None
+    ) -> Optional[int]:
         """Convert SDL device ID to PyAudio device ID"""
         if sdl_device_id is None:
             return None
 
-        mapping = self.create_device_mapping()
+        if mapping is None:
+            mapping = self.create_device_mapping()
         result = mapping["sdl_to_pyaudio"].get(sdl_device_id)
         return result if isinstance(result, int) else None
 
-    def get_device_info(self) -> dict:
-        """Get comprehensive device information for frontend"""
-        mapping = self.create_device_mapping()
+    def get_device_info(self, mapping: Optional[dict] = None) -> dict:
+        """Get comprehensive device information for frontend
+
+        Pass a mapping from create_device_mapping() to reuse it instead of
+        building a new one.
+        """
+        if mapping is None:
+            mapping = self.create_device_mapping()
 
         # Create device list for frontend with both SDL and PyAudio info
         devices = []
@@ -184,6 +454,7 @@ class SDLDeviceMapper:
             "sdl_device_count": len(mapping["sdl_devices"]),
             "pyaudio_device_count": len(mapping["pyaudio_devices"]),
             "mapped_devices": len(mapping["sdl_to_pyaudio"]),
+            "blackhole_sdl_id": mapping["blackhole_sdl_id"],
         }
 
 
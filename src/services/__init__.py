@@ -3,6 +3,13 @@
 from .app_service import AppService
 from .audio_service import AudioService
 from .device_service import DeviceService
+from .event_buffer import (
+    EventBatcher,
+    EventRing,
+    EventSubscription,
+    build_event,
+    event_timestamp,
+)
 from .llm_service import LLMService
 from .session_service import SessionService
 from .transcript_service import TranscriptService
@@ -11,7 +18,12 @@ __all__ = [
     "AppService",
     "AudioService",
     "DeviceService",
+    "EventBatcher",
+    "EventRing",
+    "EventSubscription",
     "LLMService",
     "SessionService",
     "TranscriptService",
+    "build_event",
+    "event_timestamp",
 ]
@@ -1,11 +1,13 @@
 """Main application service that coordinates all other services."""
 
-import queue
+from functools import cached_property
 from typing import Optional
 
 from ..config import get_config
+from ..llm_processor import LLMProcessor
 from .audio_service import AudioService
 from .device_service import DeviceService
+from .event_buffer import EventRing
 from .llm_service import LLMService
 from .session_service import SessionService
 from .transcript_service import TranscriptService
@@ -14,17 +16,47 @@ from .transcript_service import TranscriptService
 class AppService:
     """Main application service that coordinates all other services."""
 
-    def __init__(self, stream_queue: queue.Queue):
-        """Initialize application service with all sub-services."""
+    def __init__(self, stream_queue: EventRing):
+        """Initialize application service.
+
+        Sub-services are created on first use, so paths that never touch audio
+        don't pay for PyAudio initialization.
+        """
         self.config = get_config()
         self.stream_queue = stream_queue
 
-        # Initialize all services
-        self.session_service = SessionService(stream_queue)
-        self.device_service = DeviceService()
-        self.transcript_service = TranscriptService(stream_queue)
-        self.llm_service = LLMService(stream_queue)
-        self.audio_service = AudioService(stream_queue)
+        # Enumerate devices in the background so the UI reads a warm cache
+        DeviceService.prefetch_devices()
+
+    @cached_property
+    def llm_processor(self) -> LLMProcessor:
+        """LLM processor shared by the session and LLM services."""
+        return LLMProcessor()
+
+    @cached_property
+    def session_service(self) -> SessionService:
+        """Session management service."""
+        return SessionService(self.stream_queue, self.llm_processor)
+
+    @cached_property
+    def device_service(self) -> DeviceService:
+        """Audio device service."""
+        return DeviceService()
+
+    @cached_property
+    def transcript_service(self) -> TranscriptService:
+        """Transcript processing service."""
+        return TranscriptService(self.stream_queue)
+
+    @cached_property
+    def llm_service(self) -> LLMService:
+        """LLM processing service."""
+        return LLMService(self.stream_queue, self.llm_processor)
+
+    @cached_property
+    def audio_service(self) -> AudioService:
+        """Audio capture service."""
+        return AudioService(self.stream_queue)
 
     def start_recording(self, device_data: dict, vad_settings: dict) -> dict:
         """Start a complete recording session."""
@@ -89,7 +121,10 @@ class AppService:
             # 2. Stop audio capture
             audio_stopped = self.audio_service.stop_capture()
 
-            # 3. Stop session
+            # 3. Write pending LLM results so the session summary sees them
+            self.llm_service.flush_pending_saves()
+
+            # 4. Stop session
             session = self.session_service.stop_session()
 
             return {
@@ -112,16 +147,30 @@ class AppService:
                     return {"success": False, "error": "No active session"}
                 session_id = current_session["session_id"]
 
-            # Get accumulated transcripts
-            transcripts = self.transcript_service.get_accumulated_transcripts()
+            # Reserve LLM capacity before taking the transcripts, so they stay
+            # accumulated for the retry when every slot is in use
+            if not self.llm_service.try_reserve():
+                return {
+                    "success": False,
+                    "error": "LLM busy, retry later",
+                    "busy": True,
+                }
+
+            try:
+                # Take accumulated transcripts (clearing them in the same step)
+                transcripts = self.transcript_service.pop_accumulated_transcripts()
+            except Exception:
+                self.llm_service.release_reservation()
+                raise
+
             if not transcripts:
+                self.llm_service.release_reservation()
                 return {"success": False, "error": "No transcripts to process"}
 
-            # Process with LLM
-            job_id = self.llm_service.process_transcripts_async(transcripts, session_id)
-
-            # Clear accumulated transcripts after sending to LLM
-            self.transcript_service.clear_accumulated_transcripts()
+            # Process with LLM in the reserved slot
+            job_id = self.llm_service.process_transcripts_async(
+                transcripts, session_id, reserved=True
+            )
 
             return {
                 "success": True,
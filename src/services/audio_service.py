@@ -1,23 +1,32 @@
 """Audio processing service."""
 
-import queue
-from datetime import datetime
+import time
 from typing import Optional
 
+import numpy as np
+
 from ..audio_capture import AudioCapture
 from ..config import get_config
+from .event_buffer import EventRing
+
+# Minimum seconds between audio level events; the UI only needs ~20 updates/s
+AUDIO_LEVEL_INTERVAL = 0.05
 
 
 class AudioService:
     """Service for managing audio capture and processing."""
 
-    def __init__(self, stream_queue: queue.Queue):
+    def __init__(self, stream_queue: EventRing):
         """Initialize audio service."""
         self.config = get_config()
         self.stream_queue = stream_queue
         self.audio_capture: Optional[AudioCapture] = None
         self.is_capturing = False
 
+        # Audio level coalescing state
+        self._last_level_ts = 0.0
+        self._pending_levels: Optional[dict] = None
+
     def initialize_audio_capture(self, audio_capture: AudioCapture) -> None:
         """Initialize audio capture with callback."""
         self.audio_capture = audio_capture
@@ -68,16 +77,21 @@ class AudioService:
     def _on_audio_chunk(
         self,
         audio_data: bytes,
+        source: str = "microphone",
+        audio_level: Optional[float] = None,
         is_transcription: bool = False,
         transcript_processor=None,
     ) -> None:
         """Callback for audio chunk processing."""
         try:
-            # Calculate audio levels for volume monitoring
-            if self.audio_capture:
-                level_data = self._calculate_audio_levels(audio_data)
+            # Calculate audio levels for volume monitoring (transcription calls
+            # carry seconds of buffered audio, not a live chunk)
+            if self.audio_capture and not is_transcription:
+                level_data = self._calculate_audio_levels(
+                    audio_data, source, audio_level
+                )
                 if level_data:
-                    self._send_audio_level_event(level_data)
+                    self._queue_audio_level(level_data)
 
             # Handle transcription processing (if needed)
             if is_transcription and transcript_processor:
@@ -94,17 +108,24 @@ class AudioService:
         except Exception as e:
             print(f"❌ Error in audio chunk callback: {e}")
 
-    def _calculate_audio_levels(self, audio_data: bytes) -> Optional[dict]:
-        """Calculate audio levels from audio data."""
+    def _calculate_audio_levels(
+        self,
+        audio_data: bytes,
+        source: str = "microphone",
+        level: Optional[float] = None,
+    ) -> Optional[dict]:
+        """Calculate audio levels from audio data.
+
+        ``level`` is used as-is when the capture already computed it.
+        """
         try:
             if not self.audio_capture:
                 return None
 
-            # AudioCapture doesn't have direct level methods
-            # For now, return default values - this would need to be implemented
-            # by accessing the audio buffers in AudioCapture
-            mic_level = 0.0
-            system_level = 0.0
+            if level is None:
+                level = self._rms_level(audio_data, self.audio_capture.channels)
+            mic_level = level if source == "microphone" else 0.0
+            system_level = level if source == "system" else 0.0
 
             # Create level data
             level_data = {
@@ -117,7 +138,8 @@ class AudioService:
                     "level": system_level,
                     "percentage": min(100, max(0, system_level * 100)),
                 },
-                "timestamp": datetime.now().isoformat(),
+                # Epoch seconds; cheaper than isoformat() at audio-chunk rate
+                "timestamp": time.time(),
             }
 
             return level_data
@@ -126,13 +148,40 @@ class AudioService:
             print(f"❌ Error calculating audio levels: {e}")
             return None
 
+    @staticmethod
+    def _rms_level(audio_data: bytes, channels: int = 1) -> float:
+        """Get the 0-1 RMS level of 16-bit PCM audio (loudest channel)."""
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        if samples.size == 0:
+            return 0.0
+        if channels > 1:
+            samples = samples[: samples.size - samples.size % channels]
+            samples = samples.reshape(-1, channels)
+
+        # Square in int64 to avoid overflow without a float copy of the buffer
+        rms = np.sqrt(np.mean(np.square(samples, dtype=np.int64), axis=0)) / 32768.0
+        return float(min(np.max(rms), 1.0))
+
+    def _queue_audio_level(self, level_data: dict) -> None:
+        """Coalesce level events to one per AUDIO_LEVEL_INTERVAL, keeping peaks."""
+        pending = self._pending_levels
+        if pending is not None:
+            for source in ("microphone", "system"):
+                if pending[source]["level"] > level_data[source]["level"]:
+                    level_data[source] = pending[source]
+
+        now = time.monotonic()
+        if now - self._last_level_ts < AUDIO_LEVEL_INTERVAL:
+            self._pending_levels = level_data
+            return
+
+        self._pending_levels = None
+        self._last_level_ts = now
+        self._send_audio_level_event(level_data)
+
     def _send_audio_level_event(self, level_data: dict) -> None:
         """Send audio level event via SSE stream."""
-        try:
-            self.stream_queue.put(level_data, block=False)
-        except queue.Full:
-            # Skip if queue is full (audio levels are frequent)
-            pass
+        self.stream_queue.publish(level_data)
 
     def get_audio_devices(self) -> dict:
         """Get available audio devices."""
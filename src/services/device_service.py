@@ -1,5 +1,6 @@
 """Device management service."""
 
+import threading
 from typing import Optional
 
 from ..audio_capture import AudioCapture
@@ -15,12 +16,36 @@ class DeviceService:
         self.config = get_config()
         self.device_mapper = SDLDeviceMapper()
         self.audio_capture: Optional[AudioCapture] = AudioCapture()
-
-    def get_available_devices(self) -> dict:
+        # (mic, system) PyAudio IDs last applied to audio_capture
+        self._last_devices: Optional[tuple[Optional[int], Optional[int]]] = None
+
+    @staticmethod
+    def prefetch_devices() -> threading.Thread:
+        """Warm the device mapping cache on a background thread.
+
+        SDL enumeration spawns whisper-stream, so doing it at startup keeps the
+        first device list or recording start from waiting on it. The cache is
+        shared by all mappers, so no DeviceService (or PyAudio) is needed.
+        """
+        thread = threading.Thread(
+            target=SDLDeviceMapper().create_device_mapping,
+            name="device-prefetch",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _device_info_from(self, mapping: Optional[dict]) -> dict:
+        """Get SDL device info, building the device mapping only if not given."""
+        if mapping is None:
+            mapping = self.device_mapper.create_device_mapping()
+        return self.device_mapper.get_device_info(mapping)
+
+    def get_available_devices(self, mapping: Optional[dict] = None) -> dict:
         """Get all available audio devices."""
         try:
             # Get SDL device info for whisper.cpp
-            device_info = self.device_mapper.get_device_info()
+            device_info = self._device_info_from(mapping)
 
             # Get PyAudio devices for audio level monitoring
             input_devices, output_devices = self.audio_capture.list_devices()
@@ -41,10 +66,23 @@ class DeviceService:
             return {"success": False, "error": str(e)}
 
     def resolve_device_selection(
-        self, mic_device_id: Optional[int], system_device_id: Optional[str]
+        self,
+        mic_device_id: Optional[int],
+        system_device_id: Optional[str],
+        mapping: Optional[dict] = None,
     ) -> dict:
-        """Resolve device selection and return SDL/PyAudio device IDs."""
-        device_info = self.device_mapper.get_device_info()
+        """Resolve device selection and return SDL/PyAudio device IDs.
+
+        The returned ``device_info`` is reused by ``get_device_names`` so a
+        recording start enumerates devices at most once.
+        """
+        device_info = self._device_info_from(mapping)
+        by_pa = {
+            d["pyaudio_id"]: d
+            for d in device_info["devices"]
+            if d["pyaudio_id"] is not None
+        }
+        by_sdl = {d["sdl_id"]: d for d in device_info["devices"]}
 
         # Handle microphone device selection
         mic_sdl_id = None
@@ -52,20 +90,18 @@ class DeviceService:
 
         if mic_device_id is not None:
             # Find SDL device ID for microphone
-            for device in device_info["devices"]:
-                if device["pyaudio_id"] == mic_device_id:
-                    mic_sdl_id = device["sdl_id"]
-                    mic_pyaudio_id = device["pyaudio_id"]
-                    break
+            device = by_pa.get(mic_device_id)
+            if device:
+                mic_sdl_id = device["sdl_id"]
+                mic_pyaudio_id = device["pyaudio_id"]
 
         if mic_sdl_id is None:
             # Use default microphone (SDL device 0)
             mic_sdl_id = 0
             # Find corresponding PyAudio ID
-            for device in device_info["devices"]:
-                if device["sdl_id"] == 0:
-                    mic_pyaudio_id = device["pyaudio_id"]
-                    break
+            device = by_sdl.get(0)
+            if device:
+                mic_pyaudio_id = device["pyaudio_id"]
 
         # Handle system audio device selection
         system_sdl_id = None
@@ -88,24 +124,22 @@ class DeviceService:
                         requested_system_device = int(system_device_id)
 
                     # Find SDL device ID for system audio
-                    for device in device_info["devices"]:
-                        if device["pyaudio_id"] == requested_system_device:
-                            system_sdl_id = device["sdl_id"]
-                            system_pyaudio_id = device["pyaudio_id"]
-                            break
+                    device = by_pa.get(requested_system_device)
+                    if device:
+                        system_sdl_id = device["sdl_id"]
+                        system_pyaudio_id = device["pyaudio_id"]
                 except (ValueError, TypeError):
                     print(f"⚠️ Invalid system device ID: {system_device_id}")
 
         # Auto-detect BlackHole if no system device specified
         if system_sdl_id is None and not user_explicitly_disabled_system_audio:
-            for device in device_info["devices"]:
-                if "blackhole" in device["display_name"].lower():
-                    system_sdl_id = device["sdl_id"]
-                    system_pyaudio_id = device["pyaudio_id"]
-                    print(
-                        f"🔍 Auto-detected BlackHole: {device['display_name']} (SDL: {system_sdl_id})"
-                    )
-                    break
+            device = by_sdl.get(device_info.get("blackhole_sdl_id"))
+            if device:
+                system_sdl_id = device["sdl_id"]
+                system_pyaudio_id = device["pyaudio_id"]
+                print(
+                    f"🔍 Auto-detected BlackHole: {device['display_name']} (SDL: {system_sdl_id})"
+                )
 
         return {
             "microphone": {
@@ -124,24 +158,19 @@ class DeviceService:
     def get_device_names(self, device_selection: dict) -> dict:
         """Get human-readable device names for logging."""
         device_info = device_selection["device_info"]
+        by_sdl = {d["sdl_id"]: d for d in device_info["devices"]}
 
         # Get microphone name
         mic_name = "Default"
-        mic_sdl_id = device_selection["microphone"]["sdl_id"]
-        if mic_sdl_id is not None:
-            for device in device_info["devices"]:
-                if device["sdl_id"] == mic_sdl_id:
-                    mic_name = device["display_name"]
-                    break
+        device = by_sdl.get(device_selection["microphone"]["sdl_id"])
+        if device:
+            mic_name = device["display_name"]
 
         # Get system audio name
         sys_name = None
-        system_sdl_id = device_selection["system"]["sdl_id"]
-        if system_sdl_id is not None:
-            for device in device_info["devices"]:
-                if device["sdl_id"] == system_sdl_id:
-                    sys_name = device["display_name"]
-                    break
+        device = by_sdl.get(device_selection["system"]["sdl_id"])
+        if device:
+            sys_name = device["display_name"]
 
         return {
             "microphone": mic_name,
@@ -154,9 +183,14 @@ class DeviceService:
             mic_pyaudio_id = device_selection["microphone"]["pyaudio_id"]
             system_pyaudio_id = device_selection["system"]["pyaudio_id"]
 
+            devices = (mic_pyaudio_id, system_pyaudio_id)
+            if devices == self._last_devices:
+                return True
+
             self.audio_capture.set_devices(
                 mic_device_id=mic_pyaudio_id, system_device_id=system_pyaudio_id
             )
+            self._last_devices = devices
             return True
         except Exception as e:
             print(f"⚠️ Error configuring audio capture: {e}")
@@ -0,0 +1,185 @@
+"""Bounded buffer for Server-Sent Events."""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+log = logging.getLogger(__name__)
+
+# (epoch milliseconds, ISO string) of the last formatted event timestamp. One
+# tuple so concurrent publishers never see a mismatched pair.
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
+def event_timestamp() -> str:
+    """Get the current local time as ISO 8601, formatted at most once per ms."""
+    global _last_timestamp
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached = _last_timestamp
+    if now_ms == cached_ms:
+        return cached
+
+    seconds, millis = divmod(now_ms, 1000)
+    timestamp = (
+        datetime.fromtimestamp(seconds).replace(microsecond=millis * 1000).isoformat()
+    )
+    _last_timestamp = (now_ms, timestamp)
+    return timestamp
+
+
+def build_event(event_type: str, data: dict) -> dict:
+    """Turn ``data`` into an SSE event in place and return it.
+
+    ``type`` and ``timestamp`` are filled in unless ``data`` already has them
+    (transcript events carry their own timestamp). The dict is not copied, so
+    callers hand over a dict they no longer use.
+    """
+    data.setdefault("type", event_type)
+    if "timestamp" not in data:
+        data["timestamp"] = event_timestamp()
+    return data
+
+
+def sse_frame(event: Any) -> str:
+    """Serialize an event as a Server-Sent Events ``data:`` frame."""
+    return f"data: {json.dumps(event)}\n\n"
+
+
+class EventRing:
+    """Bounded ring of SSE events broadcast to any number of subscribers.
+
+    Every published event gets a sequence number; each subscriber tracks the
+    next sequence it wants to read, so one publish serves all SSE clients
+    without per-subscriber queues. Publishing never waits for readers: once
+    the ring wraps, the oldest events are overwritten and a subscriber that
+    fell more than ``size`` events behind skips ahead to the oldest one still
+    buffered. ``size`` is rounded up to a power of two.
+
+    Events are serialized to SSE frames once, at publish time, so the JSON
+    encoding cost does not grow with the number of subscribers.
+    """
+
+    def __init__(self, size: int = 1024):
+        """Initialize event ring."""
+        self.size = 1 << max(size - 1, 0).bit_length()
+        self._mask = self.size - 1
+        self._events: list[Optional[str]] = [None] * self.size
+        self._head = 0  # sequence number of the next event
+        self._published = threading.Condition(threading.Lock())
+
+    @property
+    def head(self) -> int:
+        """Get the sequence number the next published event will get."""
+        return self._head
+
+    def publish(self, event: Any) -> None:
+        """Append an event, overwriting the oldest one once the ring is full."""
+        try:
+            frame = sse_frame(event)
+        except (TypeError, ValueError) as e:
+            log.error(f"❌ Dropping event that is not JSON serializable: {e}")
+            return
+
+        with self._published:
+            self._events[self._head & self._mask] = frame
+            self._head += 1
+            self._published.notify_all()
+
+    def put(
+        self, event: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Queue-compatible alias for publish (never blocks)."""
+        self.publish(event)
+
+    def put_nowait(self, event: Any) -> None:
+        """Queue-compatible alias for publish."""
+        self.publish(event)
+
+    def subscribe(self) -> "EventSubscription":
+        """Start reading events published from now on."""
+        return EventSubscription(self, self._head)
+
+    def read(self, tail: int, timeout: Optional[float] = None) -> tuple[list[str], int]:
+        """Get SSE frames from sequence ``tail`` on and the sequence to read next.
+
+        Waits up to ``timeout`` seconds for an event; returns an empty list if
+        none arrived. Events already overwritten are skipped, so fewer than
+        ``next - tail`` frames come back when the reader fell behind.
+        """
+        with self._published:
+            if not self._published.wait_for(lambda: self._head > tail, timeout):
+                return [], tail
+            head = self._head
+            if head - tail > self.size:
+                tail = head - self.size
+            events: list[str] = []
+            for seq in range(tail, head):
+                frame = self._events[seq & self._mask]
+                # Slots are None until first written; never hand those out
+                if frame is not None:
+                    events.append(frame)
+        return events, head
+
+
+class EventSubscription:
+    """One reader's position in an EventRing.
+
+    ``dropped_events`` counts events this reader missed because it fell more
+    than the ring size behind.
+    """
+
+    def __init__(self, ring: EventRing, tail: int):
+        """Initialize subscription."""
+        self.ring = ring
+        self.tail = tail
+        self.dropped_events = 0
+
+    def read(self, timeout: Optional[float] = None) -> list[str]:
+        """Get the SSE frames of all events published since the last read."""
+        tail = self.tail
+        events, self.tail = self.ring.read(tail, timeout)
+        self.dropped_events += self.tail - tail - len(events)
+        return events
+
+
+class EventBatcher:
+    """Coalesce events published within a short window into one buffer item.
+
+    Bursts (e.g. several LLM callbacks completing together) then cost one
+    buffer publish and one SSE write instead of one per event. A window with a
+    single event publishes it unwrapped; otherwise the events are published as
+    ``{"type": "event_batch", "events": [...]}`` and unrolled by the client.
+    """
+
+    def __init__(self, buffer: EventRing, window: float = 0.01):
+        """Initialize event batcher."""
+        self.buffer = buffer
+        self.window = window
+        self._pending: list[dict] = []
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def add(self, event: dict) -> None:
+        """Queue an event for the current window, starting one if needed."""
+        with self._lock:
+            self._pending.append(event)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.window, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Publish all pending events now."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if len(batch) == 1:
+            self.buffer.publish(batch[0])
+        elif batch:
+            self.buffer.publish({"type": "event_batch", "events": batch})
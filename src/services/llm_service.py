@@ -1,39 +1,122 @@
 """LLM processing service."""
 
-import queue
-from datetime import datetime
+import logging
+import threading
+from operator import itemgetter
 from typing import Optional
 
 from ..config import get_config
 from ..llm_processor import LLMProcessor
 from ..models import ProcessedTranscript, ProcessedTranscriptRepository
+from .event_buffer import EventBatcher, EventRing, build_event
+from .persistence_batcher import PersistenceBatcher
+
+log = logging.getLogger(__name__)
+
+_timestamp_key = itemgetter("timestamp")
+
+# Pulls the model fields out of an LLM result in constructor order
+_processed_transcript_fields = itemgetter(*ProcessedTranscript._FIELDS)
+
+
+def _sort_by_timestamp(transcripts: list[dict]) -> None:
+    """Sort transcripts in place by timestamp (missing timestamps sort first)."""
+    for transcript in transcripts:
+        transcript.setdefault("timestamp", "")
+    transcripts.sort(key=_timestamp_key)
+
+
+class LLMBusyError(RuntimeError):
+    """Raised when the maximum number of LLM jobs is already in flight."""
 
 
 class LLMService:
     """Service for managing LLM transcript processing."""
 
-    def __init__(self, stream_queue: queue.Queue):
-        """Initialize LLM service."""
+    def __init__(
+        self,
+        stream_queue: EventRing,
+        llm_processor: Optional[LLMProcessor] = None,
+    ):
+        """Initialize LLM service.
+
+        Pass ``llm_processor`` to share one processor with other services.
+        """
         self.config = get_config()
         self.stream_queue = stream_queue
+        self._event_batcher = EventBatcher(stream_queue)
         self.processed_transcript_repository = ProcessedTranscriptRepository()
-        self.llm_processor = LLMProcessor(callback=self._on_llm_result)
+        self._persistence = PersistenceBatcher(
+            self.processed_transcript_repository.create_many,
+            self.processed_transcript_repository.create,
+            name="processed-transcript-writer",
+        )
+        self.llm_processor = llm_processor or LLMProcessor()
+        self.llm_processor.register_callback(self._on_llm_result)
+
+        # Backpressure: one slot per job submitted here until it completes
+        self._inflight_slots = threading.BoundedSemaphore(self.config.max_llm_inflight)
+        self._inflight_jobs: set[str] = set()
+        self._inflight_lock = threading.Lock()
 
     def process_transcripts_async(
-        self, transcripts: list[dict], session_id: str
+        self, transcripts: list[dict], session_id: str, reserved: bool = False
     ) -> str:
-        """Process transcripts asynchronously with LLM."""
-        if not transcripts:
-            raise ValueError("No transcripts to process")
+        """Process transcripts asynchronously with LLM.
 
-        # Sort transcripts by timestamp to maintain chronological order
-        transcripts.sort(key=lambda x: x.get("timestamp", ""))
+        Pass ``reserved=True`` when a slot was already taken with
+        ``try_reserve``; the job then uses that slot (and frees it if
+        submitting fails).
+        """
+        if not reserved and not self.try_reserve():
+            raise LLMBusyError("LLM busy, retry later")
+
+        try:
+            if not transcripts:
+                raise ValueError("No transcripts to process")
+
+            # Sort transcripts by timestamp to maintain chronological order
+            _sort_by_timestamp(transcripts)
 
-        # Process with LLM asynchronously
-        job_id = self.llm_processor.process_transcripts_async(transcripts, session_id)
+            # Process with LLM asynchronously. The lock keeps a fast completion
+            # from arriving before the job is registered.
+            with self._inflight_lock:
+                job_id = self.llm_processor.process_transcripts_async(
+                    transcripts, session_id
+                )
+                self._inflight_jobs.add(job_id)
+        except Exception:
+            self.release_reservation()
+            raise
 
         return job_id
 
+    def try_reserve(self) -> bool:
+        """Take an in-flight slot for a job about to be submitted.
+
+        Returns False if all slots are in use. A reserved slot must be handed
+        to ``process_transcripts_async(..., reserved=True)`` or given back with
+        ``release_reservation``.
+        """
+        return self._inflight_slots.acquire(blocking=False)
+
+    def release_reservation(self) -> None:
+        """Give back a slot taken with try_reserve that was not used."""
+        self._inflight_slots.release()
+
+    def is_busy(self) -> bool:
+        """Check whether no more async jobs can be submitted right now."""
+        with self._inflight_lock:
+            return len(self._inflight_jobs) >= self.config.max_llm_inflight
+
+    def _release_inflight(self, job_id: str) -> None:
+        """Free the slot of a job submitted by this service."""
+        with self._inflight_lock:
+            if job_id not in self._inflight_jobs:
+                return
+            self._inflight_jobs.discard(job_id)
+        self._inflight_slots.release()
+
     def process_transcripts_sync(
         self, transcripts: list[dict], session_id: str
     ) -> dict:
@@ -42,7 +125,7 @@ class LLMService:
             raise ValueError("No transcripts to process")
 
         # Sort transcripts by timestamp to maintain chronological order
-        transcripts.sort(key=lambda x: x.get("timestamp", ""))
+        _sort_by_timestamp(transcripts)
 
         # Process with LLM synchronously
         result = self.llm_processor.process_transcripts_sync(transcripts, session_id)
@@ -50,15 +133,15 @@ class LLMService:
         # Save result if successful
         if result.get("status") == "success":
             self._save_processed_transcript(result)
+            self.flush_pending_saves()
 
         return result
 
     def get_processor_status(self) -> dict:
         """Get LLM processor status."""
-        queue_status = self.llm_processor.get_queue_status()
         return {
             "active_jobs": 1 if self.llm_processor.is_processing else 0,
-            "queue_size": len(queue_status),
+            "queue_size": self.llm_processor.get_queue_length(),
             "is_processing": self.llm_processor.is_processing,
         }
 
@@ -70,13 +153,7 @@ class LLMService:
 
     def get_job_status(self, job_id: str) -> Optional[dict]:
         """Get status of a specific job."""
-        # LLMProcessor doesn't have get_job_status method
-        # Check if job_id exists in queue
-        queue_status = self.llm_processor.get_queue_status()
-        for job in queue_status:
-            if job.get("job_id") == job_id:
-                return job
-        return None
+        return self.llm_processor.get_job_status(job_id)
 
     def _on_llm_result(self, event_data: dict) -> None:
         """Callback for LLM processor events."""
@@ -93,6 +170,8 @@ class LLMService:
                 )
 
             elif event_data["type"] == "llm_processing_complete":
+                self._release_inflight(event_data["job_id"])
+
                 # Save processed transcript to database
                 result = event_data["result"]
                 if result.get("status") == "success":
@@ -108,6 +187,8 @@ class LLMService:
                 )
 
             elif event_data["type"] == "llm_processing_error":
+                self._release_inflight(event_data["job_id"])
+
                 # Send error via SSE
                 self._send_llm_event(
                     "llm_processing_error",
@@ -118,44 +199,27 @@ class LLMService:
                 )
 
         except Exception as e:
-            print(f"❌ Error handling LLM result: {e}")
+            log.error(f"❌ Error handling LLM result: {e}")
 
     def _save_processed_transcript(self, result: dict) -> bool:
-        """Save processed transcript to database."""
+        """Queue a processed transcript for the background database writer.
+
+        Returns True once queued; write failures are logged by the writer.
+        """
         try:
             # Create processed transcript model
-            transcript = ProcessedTranscript(
-                id=result["id"],
-                session_id=result["session_id"],
-                processed_text=result["processed_text"],
-                original_transcript_ids=result["original_transcript_ids"],
-                original_transcript_count=result["original_transcript_count"],
-                llm_model=result["llm_model"],
-                processing_time=result["processing_time"],
-                timestamp=result["timestamp"],
-            )
-
-            # Save to database
-            success = self.processed_transcript_repository.create(transcript)
-            if success:
-                print(f"✅ Saved processed transcript: {transcript.id}")
-            else:
-                print(f"❌ Failed to save processed transcript: {transcript.id}")
-
-            return success
+            transcript = ProcessedTranscript(*_processed_transcript_fields(result))
+            self._persistence.put(transcript)
+            return True
 
         except Exception as e:
-            print(f"❌ Error saving processed transcript: {e}")
+            log.error(f"❌ Error saving processed transcript: {e}")
             return False
 
+    def flush_pending_saves(self) -> bool:
+        """Wait until queued processed transcripts are written to the database."""
+        return self._persistence.flush()
+
     def _send_llm_event(self, event_type: str, data: dict) -> None:
         """Send LLM event via SSE stream."""
-        try:
-            event_data = {
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **data,
-            }
-            self.stream_queue.put(event_data, block=False)
-        except queue.Full:
-            print(f"⚠️ Stream queue full, dropping {event_type} event")
+        self._event_batcher.add(build_event(event_type, data))
@@ -0,0 +1,98 @@
+"""Write-behind batching for database inserts."""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+log = logging.getLogger(__name__)
+
+
+class PersistenceBatcher:
+    """Buffer rows and write them in batches on a background thread.
+
+    ``put`` only enqueues; the writer thread collects up to ``max_batch`` rows
+    or waits at most ``max_delay`` seconds after the first one, then hands the
+    batch to ``write_batch`` so one SQLite transaction (and one fsync) covers
+    many rows. Writers return False on failure. If a batch fails and
+    ``write_one`` is given, its rows are retried one at a time so a single bad
+    row (e.g. a duplicate id) doesn't drop the rest; failures are logged.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[Any]], bool],
+        write_one: Optional[Callable[[Any], bool]] = None,
+        max_batch: int = 32,
+        max_delay: float = 0.1,
+        name: str = "persistence-batcher",
+    ):
+        """Initialize persistence batcher."""
+        self.write_batch = write_batch
+        self.write_one = write_one
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._run, name=name, daemon=True)
+        self._writer.start()
+
+    def put(self, item: Any) -> None:
+        """Queue a row for the next batch."""
+        self._queue.put(item)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write everything queued so far, waiting up to ``timeout`` seconds."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, write it, repeat."""
+        while True:
+            batch: list[Any] = []
+            flushes: list[threading.Event] = []
+
+            item = self._queue.get()
+            deadline = time.monotonic() + self.max_delay
+            while True:
+                if isinstance(item, threading.Event):
+                    # Flush requested: write what we have right away
+                    flushes.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+
+            for done in flushes:
+                done.set()
+
+    def _write(self, batch: list[Any]) -> None:
+        """Write a batch, falling back to single rows if it fails."""
+        try:
+            if self.write_batch(batch):
+                log.debug(f"✅ Wrote batch of {len(batch)} rows")
+                return
+        except Exception as e:
+            log.error(f"❌ Error writing batch of {len(batch)} rows: {e}")
+
+        if self.write_one is None:
+            log.error(f"❌ Failed to write batch of {len(batch)} rows")
+            return
+
+        for item in batch:
+            try:
+                if not self.write_one(item):
+                    log.error(f"❌ Failed to write row: {getattr(item, 'id', item)}")
+            except Exception as e:
+                log.error(f"❌ Error writing row {getattr(item, 'id', item)}: {e}")
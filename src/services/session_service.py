@@ -1,29 +1,75 @@
 """Session management service."""
 
-import queue
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 from ..config import get_config
 from ..llm_processor import LLMProcessor
 from ..models import ProcessedTranscriptRepository, SessionRepository
+from ..models.base import DATACLASS_OPTIONS
+from .event_buffer import EventBatcher, EventRing, build_event
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class SessionState:
+    """State of the session being recorded."""
+
+    session_id: str
+    start_time: str
+    # time.monotonic() at session start; durations ignore wall-clock steps
+    start_monotonic: float
+    is_recording: bool = True
+    end_time: Optional[str] = None
+    duration: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        """Convert to the session dict returned by the service."""
+        session = {
+            "is_recording": self.is_recording,
+            "session_id": self.session_id,
+            "start_time": self.start_time,
+        }
+        if self.end_time is not None:
+            session["end_time"] = self.end_time
+            session["duration"] = self.duration
+        return session
 
 
 class SessionService:
     """Service for managing recording sessions."""
 
-    def __init__(self, stream_queue: queue.Queue):
-        """Initialize session service."""
+    def __init__(
+        self,
+        stream_queue: EventRing,
+        llm_processor: Optional[LLMProcessor] = None,
+    ):
+        """Initialize session service.
+
+        Pass ``llm_processor`` to share one processor with other services.
+        """
         self.config = get_config()
         self.session_repository = SessionRepository()
         self.processed_transcript_repository = ProcessedTranscriptRepository()
-        self.llm_processor = LLMProcessor(callback=self._on_summary_result)
+        self.llm_processor = llm_processor or LLMProcessor()
+        self.llm_processor.register_callback(self._on_summary_result)
         self.stream_queue = stream_queue
-        self.current_session: Optional[dict] = None
+        self._event_batcher = EventBatcher(stream_queue)
+        self.current_session: Optional[SessionState] = None
+
+        # Summaries take an LLM round-trip; keep them off the request thread
+        self._summary_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="sess-summary"
+        )
 
     def start_session(self) -> dict:
         """Start a new recording session."""
-        if self.current_session and self.current_session.get("is_recording"):
+        if self.current_session and self.current_session.is_recording:
             raise ValueError("Session already in progress")
 
         # Generate session ID and start time
@@ -36,11 +82,9 @@ class SessionService:
             raise RuntimeError("Failed to create session record")
 
         # Update current session state
-        self.current_session = {
-            "is_recording": True,
-            "session_id": session_id,
-            "start_time": start_time.isoformat(),
-        }
+        self.current_session = SessionState(
+            session_id, start_time.isoformat(), time.monotonic()
+        )
 
         # Send session started event
         self._send_session_event(
@@ -52,59 +96,53 @@ class SessionService:
             },
         )
 
-        return self.current_session.copy()
+        return self.current_session.to_dict()
 
     def stop_session(self) -> dict:
         """Stop the current recording session."""
-        if not self.current_session or not self.current_session.get("is_recording"):
+        session = self.current_session
+        if not session or not session.is_recording:
             raise ValueError("No active session to stop")
 
-        session_id = self.current_session["session_id"]
-        start_time_str = self.current_session["start_time"]
-        end_time = datetime.now()
+        session_id = session.session_id
+        duration = int(time.monotonic() - session.start_monotonic)
+        end_time = datetime.now().isoformat()
 
-        # Calculate duration
-        start_time = datetime.fromisoformat(start_time_str)
-        duration = int((end_time - start_time).total_seconds())
+        # Start the summary first so its transcript read overlaps the
+        # finalize write below
+        self._generate_session_summary_async(session_id)
 
         # Update session in database
-        success = self.session_repository.finalize(
-            session_id, end_time.isoformat(), duration
-        )
+        success = self.session_repository.finalize(session_id, end_time, duration)
         if not success:
-            print(f"⚠️ Failed to finalize session {session_id}")
+            log.warning(f"⚠️ Failed to finalize session {session_id}")
 
         # Update current session state
-        self.current_session.update(
-            {
-                "is_recording": False,
-                "end_time": end_time.isoformat(),
-                "duration": duration,
-            }
-        )
+        session.is_recording = False
+        session.end_time = end_time
+        session.duration = duration
 
         # Send session stopped event
         self._send_session_event(
             "session_stopped",
             {
                 "session_id": session_id,
-                "end_time": end_time.isoformat(),
+                "end_time": end_time,
                 "duration": duration,
                 "message": "🛑 Recording session stopped",
             },
         )
 
-        result = self.current_session.copy()
-
-        # Generate session summary after stopping
-        self._generate_session_summary_async(session_id)
-
         self.current_session = None
-        return result
+        return session.to_dict()
+
+    def shutdown(self) -> None:
+        """Stop accepting summary jobs without waiting for running ones."""
+        self._summary_executor.shutdown(wait=False)
 
     def get_current_session(self) -> Optional[dict]:
         """Get current session state."""
-        return self.current_session.copy() if self.current_session else None
+        return self.current_session.to_dict() if self.current_session else None
 
     def get_all_sessions(self) -> list[dict]:
         """Get all sessions with transcript counts."""
@@ -122,21 +160,18 @@ class SessionService:
 
         # Calculate metrics
         total_segments = len(transcripts)
-        total_words = 0
-        confidence_sum = 0.0
-        confidence_count = 0
-
-        for transcript in transcripts:
-            # Count words
-            text = transcript.get("text", "")
-            if text:
-                total_words += len(text.split())
-
-            # Sum confidence scores
-            confidence = transcript.get("confidence")
-            if confidence is not None:
-                confidence_sum += confidence
-                confidence_count += 1
+
+        # Count words. str.split() handles runs of any whitespace in one C pass
+        # and its list is freed right away; a space count miscounts repeated
+        # whitespace and a regex finditer is slower per word.
+        total_words = sum(len(t["text"].split()) for t in transcripts if t.get("text"))
+
+        # Sum confidence scores
+        confidences = [
+            t["confidence"] for t in transcripts if t.get("confidence") is not None
+        ]
+        confidence_sum = sum(confidences, 0.0)
+        confidence_count = len(confidences)
 
         # Calculate average confidence
         avg_confidence = (
@@ -155,42 +190,38 @@ class SessionService:
 
     def _send_session_event(self, event_type: str, data: dict) -> None:
         """Send session event via SSE stream."""
-        try:
-            event_data = {
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **data,
+        self._event_batcher.add(build_event(event_type, data))
+
+    def _get_summary_inputs(self, session_id: str) -> list[dict]:
+        """Get a session's processed transcripts in the LLM summary input format."""
+        rows = self.processed_transcript_repository.get_summary_fields(session_id)
+        return [
+            {
+                "processed_text": text,
+                "timestamp": timestamp,
+                "llm_model": model,
+                "original_transcript_count": count,
             }
-            self.stream_queue.put(event_data, block=False)
-        except queue.Full:
-            print(f"⚠️ Stream queue full, dropping {event_type} event")
+            for text, timestamp, model, count in rows
+        ]
 
     def _generate_session_summary_async(self, session_id: str) -> None:
-        """Generate session summary asynchronously after session ends."""
+        """Generate session summary in the background after session ends."""
+        self._summary_executor.submit(self._run_summary, session_id)
+
+    def _run_summary(self, session_id: str) -> None:
+        """Generate a session summary, reporting through _on_summary_result."""
         try:
             # Get all processed transcripts for this session
-            processed_transcripts = self.processed_transcript_repository.get_by_session(
-                session_id
-            )
+            transcript_dicts = self._get_summary_inputs(session_id)
 
-            if not processed_transcripts:
-                print(
+            if not transcript_dicts:
+                log.info(
                     f"ℹ️  No processed transcripts found for session {session_id}, skipping summary generation"
                 )
                 return
 
-            # Convert to dict format for LLM processor
-            transcript_dicts = [
-                {
-                    "processed_text": t.processed_text,
-                    "timestamp": t.timestamp,
-                    "llm_model": t.llm_model,
-                    "original_transcript_count": t.original_transcript_count,
-                }
-                for t in processed_transcripts
-            ]
-
-            print(
+            log.info(
                 f"📝 Generating summary for session {session_id} with {len(transcript_dicts)} processed transcripts..."
             )
 
@@ -215,7 +246,7 @@ class SessionService:
             )
 
         except Exception as e:
-            print(f"❌ Error generating session summary for {session_id}: {e}")
+            log.error(f"❌ Error generating session summary for {session_id}: {e}")
             self._on_summary_result(
                 {
                     "type": "summary_error",
@@ -248,11 +279,11 @@ class SessionService:
                 )
 
                 if success:
-                    print(
+                    log.info(
                         f"✅ Saved summary for session {session_id}: {summary[:100]}..."
                     )
                     if keywords:
-                        print(f"🏷️  Keywords: {', '.join(keywords)}")
+                        log.info(f"🏷️  Keywords: {', '.join(keywords)}")
 
                     # Send summary event via SSE
                     self._send_session_event(
@@ -265,11 +296,13 @@ class SessionService:
                         },
                     )
                 else:
-                    print(f"❌ Failed to save summary for session {session_id}")
+                    log.error(f"❌ Failed to save summary for session {session_id}")
 
             elif event_data.get("type") == "summary_error":
                 error = result.get("error", "Unknown error")
-                print(f"❌ Summary generation failed for session {session_id}: {error}")
+                log.error(
+                    f"❌ Summary generation failed for session {session_id}: {error}"
+                )
 
                 # Send error event via SSE
                 self._send_session_event(
@@ -282,33 +315,20 @@ class SessionService:
                 )
 
         except Exception as e:
-            print(f"❌ Error handling summary result: {e}")
+            log.error(f"❌ Error handling summary result: {e}")
 
     def generate_summary_for_session(self, session_id: str) -> dict:
         """Manually generate summary for a specific session."""
         try:
             # Get all processed transcripts for this session
-            processed_transcripts = self.processed_transcript_repository.get_by_session(
-                session_id
-            )
+            transcript_dicts = self._get_summary_inputs(session_id)
 
-            if not processed_transcripts:
+            if not transcript_dicts:
                 return {
                     "success": False,
                     "error": "No processed transcripts found for this session",
                 }
 
-            # Convert to dict format for LLM processor
-            transcript_dicts = [
-                {
-                    "processed_text": t.processed_text,
-                    "timestamp": t.timestamp,
-                    "llm_model": t.llm_model,
-                    "original_transcript_count": t.original_transcript_count,
-                }
-                for t in processed_transcripts
-            ]
-
             # Send summary start event via SSE
             self._send_session_event(
                 "session_summary_start",
@@ -1,7 +1,7 @@
 """Transcript processing service."""
 
-import queue
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any, Optional
 
 from ..config import get_config
@@ -11,17 +11,42 @@ from ..models import (
     RawTranscriptRepository,
 )
 from ..whisper_stream_processor import WhisperStreamProcessor
+from .event_buffer import EventRing, build_event
+from .persistence_batcher import PersistenceBatcher
+
+# Every accumulated transcript is created with a timestamp
+_timestamp_key = itemgetter("timestamp")
+
+
+def _merge_by_timestamp(
+    mic_transcripts: list[dict], system_transcripts: list[dict]
+) -> list[dict]:
+    """Merge two per-source transcript lists into chronological order.
+
+    Each list is already in arrival order, so Timsort sees two runs and does a
+    single linear merge in C (faster than heapq.merge's Python-level merge).
+    """
+    merged = mic_transcripts + system_transcripts
+    merged.sort(key=_timestamp_key)
+    return merged
 
 
 class TranscriptService:
     """Service for managing transcript processing."""
 
-    def __init__(self, stream_queue: queue.Queue):
+    def __init__(self, stream_queue: EventRing):
         """Initialize transcript service."""
         self.config = get_config()
         self.stream_queue = stream_queue
         self.raw_transcript_repository = RawTranscriptRepository()
         self.processed_transcript_repository = ProcessedTranscriptRepository()
+        # Raw transcripts are written in batches (32 rows or 500 ms)
+        self._persistence = PersistenceBatcher(
+            self.raw_transcript_repository.create_many,
+            self.raw_transcript_repository.create,
+            max_delay=0.5,
+            name="raw-transcript-writer",
+        )
 
         # Whisper processors
         self.mic_whisper_processor: Optional[WhisperStreamProcessor] = None
@@ -91,37 +116,61 @@ class TranscriptService:
         mic_result = {}
         system_result = {}
 
-        if self.mic_whisper_processor:
-            mic_result = self.mic_whisper_processor.stop_streaming()
+        # Each stop waits for its whisper-stream process to exit, so stop both
+        # at once instead of paying the two shutdowns back to back
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            mic_future = system_future = None
+            if self.mic_whisper_processor:
+                mic_future = pool.submit(self.mic_whisper_processor.stop_streaming)
+            if self.system_whisper_processor:
+                system_future = pool.submit(
+                    self.system_whisper_processor.stop_streaming
+                )
 
-        if self.system_whisper_processor:
-            system_result = self.system_whisper_processor.stop_streaming()
+            if mic_future:
+                mic_result = mic_future.result()
+            if system_future:
+                system_result = system_future.result()
+
+        # Make the session's last transcripts durable before stop returns
+        self.flush_pending_saves()
 
         return {
             "microphone_stopped": mic_result,
             "system_stopped": system_result,
         }
 
+    def flush_pending_saves(self) -> bool:
+        """Wait until queued raw transcripts are written to the database."""
+        return self._persistence.flush()
+
     def get_accumulated_transcripts(self) -> list[dict]:
         """Get all accumulated transcripts from both sources."""
-        accumulated_transcripts = []
-
-        # Add microphone transcripts
-        if self.mic_whisper_processor:
-            mic_transcripts = self.mic_whisper_processor.get_accumulated_transcripts()
-            accumulated_transcripts.extend(mic_transcripts)
-
-        # Add system audio transcripts
-        if self.system_whisper_processor:
-            system_transcripts = (
-                self.system_whisper_processor.get_accumulated_transcripts()
-            )
-            accumulated_transcripts.extend(system_transcripts)
-
-        # Sort by timestamp to maintain chronological order
-        accumulated_transcripts.sort(key=lambda x: x.get("timestamp", ""))
-
-        return accumulated_transcripts
+        mic_transcripts = (
+            self.mic_whisper_processor.get_accumulated_transcripts()
+            if self.mic_whisper_processor
+            else []
+        )
+        system_transcripts = (
+            self.system_whisper_processor.get_accumulated_transcripts()
+            if self.system_whisper_processor
+            else []
+        )
+        return _merge_by_timestamp(mic_transcripts, system_transcripts)
+
+    def pop_accumulated_transcripts(self) -> list[dict]:
+        """Take all accumulated transcripts from both sources, clearing them."""
+        mic_transcripts = (
+            self.mic_whisper_processor.pop_accumulated_transcripts()
+            if self.mic_whisper_processor
+            else []
+        )
+        system_transcripts = (
+            self.system_whisper_processor.pop_accumulated_transcripts()
+            if self.system_whisper_processor
+            else []
+        )
+        return _merge_by_timestamp(mic_transcripts, system_transcripts)
 
     def clear_accumulated_transcripts(self) -> None:
         """Clear accumulated transcripts from all processors."""
@@ -140,23 +189,11 @@ class TranscriptService:
 
         if self.mic_whisper_processor:
             mic_active = self.mic_whisper_processor.is_running
-            try:
-                mic_transcripts = (
-                    self.mic_whisper_processor.get_accumulated_transcripts()
-                )
-                mic_count = len(mic_transcripts) if mic_transcripts else 0
-            except Exception:
-                mic_count = 0
+            mic_count = self.mic_whisper_processor.accumulated_count
 
         if self.system_whisper_processor:
             system_active = self.system_whisper_processor.is_running
-            try:
-                system_transcripts = (
-                    self.system_whisper_processor.get_accumulated_transcripts()
-                )
-                system_count = len(system_transcripts) if system_transcripts else 0
-            except Exception:
-                system_count = 0
+            system_count = self.system_whisper_processor.accumulated_count
 
         return {
             "microphone_active": mic_active,
@@ -175,8 +212,9 @@ class TranscriptService:
         result = {}
 
         if transcript_type in ["raw", "both"]:
-            raw_transcripts = self.raw_transcript_repository.get_by_session(session_id)
-            result["raw"] = [t.to_dict() for t in raw_transcripts]
+            result["raw"] = list(
+                self.raw_transcript_repository.iter_dicts_by_session(session_id)
+            )
 
         if transcript_type in ["processed", "both"]:
             processed_transcripts = self.processed_transcript_repository.get_by_session(
@@ -201,11 +239,8 @@ class TranscriptService:
                 audio_source=transcript_data.get("audio_source", "unknown"),
             )
 
-            # Save to database
-            success = self.raw_transcript_repository.create(transcript)
-            if not success:
-                print(f"❌ Failed to save transcript: {transcript.id}")
-                return
+            # Queue for the batched database writer
+            self._persistence.put(transcript)
 
             # Send via SSE stream
             self._send_transcript_event("transcript", transcript_data)
@@ -215,12 +250,4 @@ class TranscriptService:
 
     def _send_transcript_event(self, event_type: str, data: dict) -> None:
         """Send transcript event via SSE stream."""
-        try:
-            event_data = {
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **data,
-            }
-            self.stream_queue.put(event_data, block=False)
-        except queue.Full:
-            print(f"⚠️ Stream queue full, dropping {event_type} event")
+        self.stream_queue.publish(build_event(event_type, data))
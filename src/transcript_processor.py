@@ -5,8 +5,8 @@ Handles Whisper transcription and text processing using whisper.cpp
 """
 
 import os
+import threading
 import time
-from collections import deque
 
 # Handle both relative and absolute imports
 try:
@@ -14,6 +14,11 @@ try:
 except ImportError:
     from src.whisper_cpp_client import WhisperCppClient
 
+# whisper.cpp clients shared by server URL, so processors reuse one connection
+# pool and skip the startup connection check
+_CLIENT_POOL: dict[str, WhisperCppClient] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
 
 class TranscriptProcessor:
     def __init__(
@@ -24,8 +29,6 @@ class TranscriptProcessor:
         self.server_url = server_url
         self.is_processing = False
 
-        # Processing queue
-        self.audio_queue = deque()
         self.processing_thread = None
 
         # Statistics
@@ -40,7 +43,12 @@ class TranscriptProcessor:
         try:
             print(f"Initializing whisper.cpp client (model: {self.model_name})...")
             start_time = time.time()
-            self.client = WhisperCppClient(server_url=self.server_url)
+            with _CLIENT_POOL_LOCK:
+                if self.server_url not in _CLIENT_POOL:
+                    _CLIENT_POOL[self.server_url] = WhisperCppClient(
+                        server_url=self.server_url
+                    )
+                self.client = _CLIENT_POOL[self.server_url]
             init_time = time.time() - start_time
             print(f"✅ Whisper.cpp client initialized in {init_time:.2f}s")
         except Exception as e:
@@ -53,7 +61,9 @@ class TranscriptProcessor:
             return None
 
         try:
-            # Transcribe with whisper.cpp client
+            # Each chunk is sent as-is: AudioCapture already hands over ~3 s
+            # windows, and mic/system chunks share this processor, so joining
+            # chunks would mix sources in one request.
             result = self.client.transcribe_audio_data(
                 audio_data, sample_rate=16000, channels=1, language=self.language
             )
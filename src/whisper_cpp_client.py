@@ -4,13 +4,114 @@ Whisper.cpp Client Module
 Interfaces with the whisper.cpp server for transcription
 """
 
+import functools
 import os
-import tempfile
+import struct
 import time
-import wave
+import uuid
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# RIFF/WAVE header of a PCM WAV file: RIFF chunk, 16-byte fmt chunk, data
+# chunk header (44 bytes)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+@functools.lru_cache(maxsize=64)
+def _wav_header(sample_rate: int, channels: int, data_size: int) -> bytes:
+    """Build the 44-byte header of a 16-bit PCM WAV file"""
+    block_align = channels * 2  # 16-bit samples
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # PCM fmt chunk size
+        1,  # PCM format
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _form_fields(language: Optional[str], temperature: float) -> dict[str, str]:
+    """Build the form fields for an inference request (shared, don't mutate)"""
+    fields = {"response_format": "json", "temperature": str(temperature)}
+    if language:
+        fields["language"] = language
+    return fields
+
+
+class _MultipartUpload:
+    """Streaming multipart/form-data body with form fields and one file field.
+
+    requests' ``files=`` encodes the whole body into a single bytes object,
+    copying the audio once more. Here the file is given as a list of parts
+    (e.g. WAV header and PCM bytes) that are read out block by block; with
+    ``__len__`` requests sends a Content-Length instead of chunked encoding
+    and http.client pulls the body through ``read``.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        filename: str,
+        content_type: str,
+        file_parts: list[bytes],
+    ):
+        """Initialize multipart upload."""
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = "".join(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+            for name, value in fields.items()
+        )
+        head += (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        tail = f"\r\n--{boundary}--\r\n"
+
+        self._parts = [
+            memoryview(part)
+            for part in (head.encode(), *file_parts, tail.encode())
+            if part
+        ]
+        self._length = sum(part.nbytes for part in self._parts)
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return (part.tobytes() for part in self._parts)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (the rest of the current part if -1)."""
+        if self._index >= len(self._parts):
+            return b""
+
+        part = self._parts[self._index]
+        end = part.nbytes if size < 0 else min(self._offset + size, part.nbytes)
+        block = part[self._offset : end].tobytes()
+        if end == part.nbytes:
+            self._index += 1
+            self._offset = 0
+        else:
+            self._offset = end
+        return block
 
 
 class WhisperCppClient:
@@ -26,6 +127,13 @@ class WhisperCppClient:
         self.inference_endpoint = f"{self.server_url}/inference"
         self.timeout = timeout
 
+        # Reuse keep-alive connections to the server instead of opening a new
+        # TCP connection per chunk
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Statistics
         self.total_requests = 0
         self.total_processing_time = 0
@@ -37,7 +145,7 @@ class WhisperCppClient:
     def _test_connection(self):
         """Test if the whisper.cpp server is accessible"""
         try:
-            requests.get(self.server_url, timeout=5)
+            self.session.get(self.server_url, timeout=5)
             print(f"✅ Connected to whisper.cpp server at {self.server_url}")
         except requests.exceptions.RequestException as e:
             print(
@@ -72,20 +180,12 @@ class WhisperCppClient:
         if not audio_data:
             return None
 
-        # Convert audio data to temporary WAV file
-        temp_file = self._audio_data_to_temp_file(audio_data, sample_rate, channels)
-        if not temp_file:
-            return None
-
-        try:
-            result = self.transcribe_file(temp_file, language, temperature)
-            return result
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except Exception:
-                pass
+        # Upload the WAV header followed by the PCM bytes as they are, without
+        # assembling a WAV (or a temp file) first
+        header = _wav_header(sample_rate, channels, len(audio_data))
+        return self._transcribe(
+            ("audio.wav", [header, audio_data], "audio/wav"), language, temperature
+        )
 
     def transcribe_file(
         self, file_path: str, language: Optional[str] = None, temperature: float = 0.0
@@ -105,26 +205,48 @@ class WhisperCppClient:
             print(f"❌ Audio file not found: {file_path}")
             return None
 
+        with open(file_path, "rb") as audio_file:
+            return self._transcribe(audio_file, language, temperature)
+
+    def _transcribe(
+        self, audio_file: Any, language: Optional[str], temperature: float
+    ) -> Optional[dict[str, Any]]:
+        """
+        Send audio to the whisper.cpp inference endpoint
+
+        Args:
+            audio_file: Open file or (filename, byte parts, content type) tuple
+            language: Target language (optional)
+            temperature: Sampling temperature
+
+        Returns:
+            Dictionary with transcription results or None if failed
+        """
         try:
             start_time = time.time()
 
-            # Prepare the request
-            files = {"file": open(file_path, "rb")}
-            data = {"response_format": "json", "temperature": str(temperature)}
-
-            if language:
-                data["language"] = language
+            # Prepare the request (the fields only vary with these settings)
+            data = _form_fields(language, temperature)
 
             # Make the request to whisper.cpp server
-            response = requests.post(
-                self.inference_endpoint, files=files, data=data, timeout=self.timeout
-            )
+            if isinstance(audio_file, tuple):
+                body = _MultipartUpload(data, *audio_file)
+                response = self.session.post(
+                    self.inference_endpoint,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                    timeout=self.timeout,
+                )
+            else:
+                response = self.session.post(
+                    self.inference_endpoint,
+                    files={"file": audio_file},
+                    data=data,
+                    timeout=self.timeout,
+                )
 
             processing_time = time.time() - start_time
 
-            # Close the file
-            files["file"].close()
-
             if response.status_code == 200:
                 result = response.json()
 
@@ -162,28 +284,6 @@ class WhisperCppClient:
             self.failed_requests += 1
             return None
 
-    def _audio_data_to_temp_file(
-        self, audio_data: bytes, sample_rate: int = 16000, channels: int = 1
-    ) -> Optional[str]:
-        """Convert raw audio data to a temporary WAV file"""
-        try:
-            # Create temporary file
-            temp_fd, temp_path = tempfile.mkstemp(suffix=".wav")
-
-            with os.fdopen(temp_fd, "wb") as temp_file:
-                # Create WAV file
-                with wave.open(temp_file, "wb") as wav_file:
-                    wav_file.setnchannels(channels)
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes(audio_data)
-
-            return temp_path
-
-        except Exception as e:
-            print(f"❌ Error creating temp audio file: {e}")
-            return None
-
     def _format_result(
         self, whisper_result: dict[str, Any], processing_time: float
     ) -> dict[str, Any]:
@@ -225,7 +325,9 @@ class WhisperCppClient:
     def _calculate_confidence(self, whisper_result: dict[str, Any]) -> float:
         """Calculate confidence score from whisper.cpp result"""
         try:
-            # If we have segments with confidence scores, use them
+            # If we have segments with confidence scores, use them. Only
+            # verbose_json responses carry segments, a handful per chunk, so a
+            # plain loop beats building NumPy arrays here.
             segments = whisper_result.get("segments", [])
             if segments:
                 total_confidence = 0
@@ -236,16 +338,16 @@ class WhisperCppClient:
                     segment_confidence = 0.7  # Default confidence
 
                     # Use avg_logprob if available (higher is better, typically negative)
-                    if "avg_logprob" in segment:
-                        avg_logprob = segment["avg_logprob"]
+                    avg_logprob = segment.get("avg_logprob")
+                    if avg_logprob is not None:
                         # Convert logprob to confidence (rough approximation)
                         segment_confidence = max(
                             0.1, min(1.0, (avg_logprob + 1.0) * 0.5 + 0.5)
                         )
 
                     # Use no_speech_prob if available (lower is better)
-                    if "no_speech_prob" in segment:
-                        no_speech_prob = segment["no_speech_prob"]
+                    no_speech_prob = segment.get("no_speech_prob")
+                    if no_speech_prob is not None:
                         segment_confidence *= 1.0 - no_speech_prob
 
                     # Weight by segment duration
@@ -269,6 +371,10 @@ class WhisperCppClient:
             print(f"❌ Error calculating confidence: {e}")
             return 0.5
 
+    def close(self):
+        """Close pooled connections to the whisper.cpp server"""
+        self.session.close()
+
     def get_stats(self) -> dict[str, Any]:
         """Get client statistics"""
         avg_processing_time = 0
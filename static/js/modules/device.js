@@ -70,7 +70,7 @@ class DeviceModule extends ModuleBase {
      */
     setupEventListeners() {
         // Listen for device-related events
-        this.on('device:refresh_requested', () => this.loadAudioDevices());
+        this.on('device:refresh_requested', () => this.loadAudioDevices(true));
         this.on('device:selection_changed', (data) => this.handleDeviceSelectionChange(data));
         this.on('device:audio_level', (data) => this.updateAudioLevels(data));
 
@@ -124,13 +124,14 @@ class DeviceModule extends ModuleBase {
 
     /**
      * Load available audio devices
+     * @param {boolean} refresh - Bypass the server-side device cache
      */
-    async loadAudioDevices() {
+    async loadAudioDevices(refresh = false) {
         console.log('🔄 Loading audio devices...');
         this.setState('isLoading', true);
 
         try {
-            const response = await fetch('/api/audio-devices');
+            const response = await fetch(refresh ? '/api/audio-devices?refresh=1' : '/api/audio-devices');
             const data = await response.json();
 
             if (data.success) {
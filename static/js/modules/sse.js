@@ -170,6 +170,12 @@ class SSEModule extends ModuleBase {
     routeMessage(data) {
         const messageType = data.type;
 
+        // Batched events from the server are routed one by one
+        if (messageType === 'event_batch') {
+            data.events.forEach((event) => this.routeMessage(event));
+            return;
+        }
+
         // Update heartbeat for any message
         this.lastHeartbeat = Date.now();
         this.setState('lastHeartbeat', this.lastHeartbeat);
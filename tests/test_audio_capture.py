@@ -0,0 +1,71 @@
+"""Tests for the int16 ring buffer holding recent capture audio."""
+
+import numpy as np
+
+from src.audio_capture import AudioRingBuffer
+
+
+def pcm(values):
+    return np.array(list(values), dtype=np.int16).tobytes()
+
+
+def samples(data):
+    return np.frombuffer(data, dtype=np.int16).tolist()
+
+
+def test_empty_buffer():
+    buffer = AudioRingBuffer(8)
+
+    assert len(buffer) == 0
+    assert buffer.getvalue() == b""
+    assert buffer.latest(4) == b""
+
+
+def test_append_within_capacity():
+    buffer = AudioRingBuffer(8)
+    buffer.append(pcm(range(5)))
+
+    assert len(buffer) == 5
+    assert samples(buffer.getvalue()) == [0, 1, 2, 3, 4]
+    assert samples(buffer.latest(3)) == [2, 3, 4]
+    assert samples(buffer.latest(100)) == [0, 1, 2, 3, 4]
+
+
+def test_append_across_wrap_point():
+    buffer = AudioRingBuffer(8)
+    buffer.append(pcm(range(6)))
+    buffer.append(pcm(range(6, 11)))
+
+    assert len(buffer) == 8
+    assert samples(buffer.getvalue()) == list(range(3, 11))
+    # Spans the end and the start of the ring
+    assert samples(buffer.latest(5)) == [6, 7, 8, 9, 10]
+    # Lies entirely after the wrap point
+    assert samples(buffer.latest(2)) == [9, 10]
+
+
+def test_append_larger_than_capacity():
+    buffer = AudioRingBuffer(8)
+    buffer.append(pcm(range(20)))
+
+    assert len(buffer) == 8
+    assert samples(buffer.getvalue()) == list(range(12, 20))
+
+
+def test_append_larger_than_capacity_after_partial_fill():
+    buffer = AudioRingBuffer(8)
+    buffer.append(pcm(range(3)))
+    buffer.append(pcm(range(3, 23)))
+
+    assert samples(buffer.getvalue()) == list(range(15, 23))
+
+    buffer.append(pcm([23, 24]))
+    assert samples(buffer.getvalue()) == list(range(17, 25))
+    assert samples(buffer.latest(3)) == [22, 23, 24]
+
+
+def test_negative_samples_survive_round_trip():
+    buffer = AudioRingBuffer(4)
+    buffer.append(pcm([-32768, -1, 0, 32767, -5]))
+
+    assert samples(buffer.getvalue()) == [-1, 0, 32767, -5]
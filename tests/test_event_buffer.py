@@ -0,0 +1,71 @@
+"""Tests for the sequenced SSE event ring."""
+
+from src.services.event_buffer import EventRing, sse_frame
+
+
+def frames(*events):
+    return [sse_frame(event) for event in events]
+
+
+def test_size_rounds_up_to_power_of_two():
+    assert EventRing(5).size == 8
+    assert EventRing(8).size == 8
+    assert EventRing(1).size == 1
+
+
+def test_subscriber_reads_events_published_after_subscribing():
+    ring = EventRing(4)
+    ring.publish({"n": 0})
+    sub = ring.subscribe()
+    ring.publish({"n": 1})
+    ring.publish({"n": 2})
+
+    assert sub.read(timeout=0) == frames({"n": 1}, {"n": 2})
+    assert sub.read(timeout=0) == []
+    assert sub.dropped_events == 0
+
+
+def test_read_across_wraparound():
+    ring = EventRing(4)
+    sub = ring.subscribe()
+    for n in range(3):
+        ring.publish(n)
+    assert sub.read(timeout=0) == frames(0, 1, 2)
+
+    # Slots 3, 0, 1 and 2: the ring wraps but nothing unread is overwritten
+    for n in range(3, 7):
+        ring.publish(n)
+    assert sub.read(timeout=0) == frames(3, 4, 5, 6)
+    assert sub.dropped_events == 0
+    assert ring.head == 7
+
+
+def test_lagging_subscriber_skips_to_oldest_buffered_event():
+    ring = EventRing(4)
+    slow = ring.subscribe()
+    fast = ring.subscribe()
+    for n in range(3):
+        ring.publish(n)
+    assert fast.read(timeout=0) == frames(0, 1, 2)
+
+    for n in range(3, 10):
+        ring.publish(n)
+
+    assert slow.read(timeout=0) == frames(6, 7, 8, 9)
+    assert slow.dropped_events == 6
+    # Events 3-5 were overwritten before fast read them too
+    assert fast.read(timeout=0) == frames(6, 7, 8, 9)
+    assert fast.dropped_events == 3
+
+    ring.publish(10)
+    assert slow.read(timeout=0) == frames(10)
+    assert slow.dropped_events == 6
+
+
+def test_unserializable_event_is_dropped():
+    ring = EventRing(4)
+    sub = ring.subscribe()
+    ring.publish({"bad": object()})
+    ring.publish({"ok": True})
+
+    assert sub.read(timeout=0) == frames({"ok": True})
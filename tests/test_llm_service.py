@@ -0,0 +1,121 @@
+"""Tests for LLM job backpressure in LLMService."""
+
+import pytest
+
+from src.config import settings
+from src.config.settings import AppConfig
+from src.services.event_buffer import EventRing
+from src.services.llm_service import LLMBusyError, LLMService
+
+TRANSCRIPTS = [{"text": "hello", "timestamp": "2025-01-01T00:00:00"}]
+
+
+class FakeProcessor:
+    """Stands in for the shared LLMProcessor: records jobs, emits events."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.submitted = []
+        self.fail = False
+
+    def register_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def process_transcripts_async(self, transcripts, session_id):
+        if self.fail:
+            raise RuntimeError("queue closed")
+        job_id = f"job-{len(self.submitted)}"
+        self.submitted.append(job_id)
+        return job_id
+
+    def emit(self, event_type, job_id):
+        event = {"type": event_type, "job_id": job_id}
+        if event_type == "llm_processing_complete":
+            event["result"] = {"status": "error"}
+        else:
+            event["error"] = "failed"
+        for callback in self.callbacks:
+            callback(event)
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setattr(settings, "_config", AppConfig(max_llm_inflight=2))
+    return FakeProcessor()
+
+
+@pytest.fixture
+def service(processor):
+    return LLMService(EventRing(), llm_processor=processor)
+
+
+def fill(service):
+    return [
+        service.process_transcripts_async(list(TRANSCRIPTS), "s1") for _ in range(2)
+    ]
+
+
+def test_busy_when_all_slots_are_taken(service):
+    fill(service)
+
+    assert service.is_busy()
+    assert not service.try_reserve()
+    with pytest.raises(LLMBusyError):
+        service.process_transcripts_async(list(TRANSCRIPTS), "s1")
+
+
+@pytest.mark.parametrize(
+    "event_type", ["llm_processing_complete", "llm_processing_error"]
+)
+def test_completion_and_error_events_release_the_slot(service, processor, event_type):
+    first, _ = fill(service)
+
+    processor.emit(event_type, first)
+
+    assert not service.is_busy()
+    assert service.process_transcripts_async(list(TRANSCRIPTS), "s1") == "job-2"
+    # A repeated event for the same job frees nothing more
+    processor.emit(event_type, first)
+    assert not service.try_reserve()
+
+
+def test_reservation_is_returned_when_submission_raises(service, processor):
+    processor.fail = True
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            service.process_transcripts_async(list(TRANSCRIPTS), "s1")
+
+    assert service.try_reserve()
+    with pytest.raises(RuntimeError):
+        service.process_transcripts_async(list(TRANSCRIPTS), "s1", reserved=True)
+
+    processor.fail = False
+    assert fill(service) == ["job-0", "job-1"]
+
+
+def test_empty_transcripts_return_the_reservation(service):
+    assert service.try_reserve()
+    with pytest.raises(ValueError):
+        service.process_transcripts_async([], "s1", reserved=True)
+
+    assert len(fill(service)) == 2
+
+
+def test_unreserved_slot_can_be_released(service):
+    assert service.try_reserve()
+    assert service.try_reserve()
+    assert not service.try_reserve()
+
+    service.release_reservation()
+    assert service.try_reserve()
+
+
+def test_ignores_events_for_jobs_submitted_elsewhere(service, processor):
+    fill(service)
+
+    # The processor is shared, so other services' jobs report here too
+    processor.emit("llm_processing_complete", "other-job")
+    processor.emit("llm_processing_error", "other-job")
+
+    assert service.is_busy()
+    assert not service.try_reserve()
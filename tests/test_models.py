@@ -0,0 +1,117 @@
+"""Tests for the generated row mappers of the database models."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from src.models.base import DATACLASS_OPTIONS, RowModel
+from src.models.session import Session
+from src.models.transcript import ProcessedTranscript, RawTranscript
+
+RAW_ROW = (
+    "raw-1",
+    "session-1",
+    "hello there",
+    "2025-01-01T00:00:00",
+    3,
+    0.9,
+    0.2,
+    "mic",
+)
+
+# Sessions table columns before the bookmark migration, after the bookmark
+# and summary migrations, and the current full schema
+SESSION_BASE = ("s1", "2025-01-01T00:00:00", None, 60, 4, 4, 1, 12, 0.8, 4, 3.2)
+SESSION_SUMMARY = SESSION_BASE + (1, "A summary")
+SESSION_FULL = SESSION_SUMMARY + ('["alpha", "beta"]', "2025-01-01T00:01:00")
+
+
+def test_from_db_row_exact_length():
+    transcript = RawTranscript.from_db_row(RAW_ROW)
+
+    assert transcript == RawTranscript(*RAW_ROW)
+
+
+def test_from_db_row_short_row_keeps_defaults():
+    transcript = RawTranscript.from_db_row(RAW_ROW[:5])
+
+    assert transcript.sequence_number == 3
+    assert transcript.confidence is None
+    assert transcript.processing_time is None
+    assert transcript.audio_source == "unknown"
+
+
+def test_from_db_row_ignores_extra_columns():
+    transcript = RawTranscript.from_db_row(RAW_ROW + ("extra", 42))
+
+    assert transcript == RawTranscript(*RAW_ROW)
+
+
+def test_from_db_row_too_short_raises_value_error():
+    with pytest.raises(ValueError, match="RawTranscript .* 1 columns"):
+        RawTranscript.from_db_row(("raw-1",))
+
+
+def test_from_db_row_applies_converters():
+    transcript = ProcessedTranscript.from_db_row(
+        ("p1", "s1", "text", '["a", "b"]', 2, "model", 1.5, "2025-01-01T00:00:00")
+    )
+
+    assert transcript.original_transcript_ids == ["a", "b"]
+
+
+def test_session_before_bookmark_migration():
+    session = Session.from_db_row(SESSION_BASE)
+
+    assert session.confidence_sum == 3.2
+    assert session.bookmarked is False
+    assert session.summary is None
+    assert session.keywords is None
+    assert session.summary_generated_at is None
+
+
+def test_session_after_summary_migration():
+    session = Session.from_db_row(SESSION_SUMMARY)
+
+    assert session.bookmarked is True
+    assert session.summary == "A summary"
+    assert session.keywords is None
+
+
+def test_session_full_schema():
+    session = Session.from_db_row(SESSION_FULL)
+
+    assert session.bookmarked is True
+    assert session.keywords == ["alpha", "beta"]
+    assert session.summary_generated_at == "2025-01-01T00:01:00"
+
+
+def test_session_invalid_keywords_json():
+    session = Session.from_db_row(SESSION_SUMMARY + ("not json", None))
+
+    assert session.keywords is None
+
+
+def test_to_dict_lists_fields_in_declaration_order():
+    transcript = RawTranscript(*RAW_ROW)
+
+    assert transcript.to_dict() == {
+        "id": "raw-1",
+        "session_id": "session-1",
+        "text": "hello there",
+        "timestamp": "2025-01-01T00:00:00",
+        "sequence_number": 3,
+        "confidence": 0.9,
+        "processing_time": 0.2,
+        "audio_source": "mic",
+    }
+    assert list(Session.from_db_row(SESSION_FULL).to_dict()) == list(Session._FIELDS)
+
+
+def test_undecorated_model_raises_value_error():
+    @dataclass(**DATACLASS_OPTIONS)
+    class Plain(RowModel):
+        id: str
+
+    with pytest.raises(ValueError, match="Plain"):
+        Plain.from_db_row(("x",))
@@ -0,0 +1,85 @@
+"""Tests for write-behind batching of database inserts."""
+
+import threading
+
+from src.services.persistence_batcher import PersistenceBatcher
+
+
+class Recorder:
+    """Collect written batches and rows, signalling each batch write."""
+
+    def __init__(self, batch_result=True):
+        self.batch_result = batch_result
+        self.batches = []
+        self.rows = []
+        self.batch_written = threading.Event()
+
+    def write_batch(self, batch):
+        self.batches.append(list(batch))
+        self.batch_written.set()
+        if isinstance(self.batch_result, Exception):
+            raise self.batch_result
+        return self.batch_result
+
+    def write_one(self, row):
+        if row == "bad":
+            return False
+        self.rows.append(row)
+        return True
+
+
+def test_writes_when_batch_is_full():
+    recorder = Recorder()
+    batcher = PersistenceBatcher(recorder.write_batch, max_batch=3, max_delay=60)
+    for row in range(3):
+        batcher.put(row)
+
+    assert recorder.batch_written.wait(5)
+    assert recorder.batches == [[0, 1, 2]]
+
+
+def test_writes_partial_batch_after_max_delay():
+    recorder = Recorder()
+    batcher = PersistenceBatcher(recorder.write_batch, max_batch=32, max_delay=0.05)
+    batcher.put("a")
+    batcher.put("b")
+
+    assert recorder.batch_written.wait(5)
+    assert recorder.batches == [["a", "b"]]
+
+
+def test_flush_writes_pending_rows_immediately():
+    recorder = Recorder()
+    batcher = PersistenceBatcher(recorder.write_batch, max_batch=32, max_delay=60)
+    batcher.put("a")
+    batcher.put("b")
+
+    assert batcher.flush(timeout=5)
+    assert recorder.batches == [["a", "b"]]
+    assert batcher.flush(timeout=5)
+    assert recorder.batches == [["a", "b"]]
+
+
+def test_failed_batch_falls_back_to_single_rows():
+    recorder = Recorder(batch_result=False)
+    batcher = PersistenceBatcher(
+        recorder.write_batch, recorder.write_one, max_batch=32, max_delay=60
+    )
+    for row in ("a", "bad", "c"):
+        batcher.put(row)
+
+    assert batcher.flush(timeout=5)
+    assert recorder.batches == [["a", "bad", "c"]]
+    assert recorder.rows == ["a", "c"]
+
+
+def test_raising_batch_falls_back_to_single_rows():
+    recorder = Recorder(batch_result=RuntimeError("UNIQUE constraint failed"))
+    batcher = PersistenceBatcher(
+        recorder.write_batch, recorder.write_one, max_batch=32, max_delay=60
+    )
+    batcher.put("a")
+    batcher.put("b")
+
+    assert batcher.flush(timeout=5)
+    assert recorder.rows == ["a", "b"]
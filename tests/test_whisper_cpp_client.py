@@ -0,0 +1,74 @@
+"""Tests for the streaming multipart body used for whisper.cpp uploads."""
+
+import email
+import email.policy
+
+import requests
+
+from src.whisper_cpp_client import _MultipartUpload
+
+FIELDS = {"response_format": "json", "temperature": "0.0"}
+WAV_HEADER = b"RIFF\x24\x00\x00\x00WAVEfmt "
+PCM = bytes(range(256)) * 40
+
+
+def make_upload():
+    return _MultipartUpload(FIELDS, "audio.wav", "audio/wav", [WAV_HEADER, PCM])
+
+
+def read_all(upload, size):
+    blocks = []
+    while block := upload.read(size):
+        blocks.append(block)
+    return b"".join(blocks)
+
+
+def parse(content_type, body):
+    message = email.message_from_bytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body,
+        policy=email.policy.HTTP,
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.iter_parts()
+    }
+
+
+def test_body_round_trips_through_multipart_parser():
+    upload = make_upload()
+    body = read_all(upload, 8192)
+    parts = parse(upload.content_type, body)
+
+    assert set(parts) == {*FIELDS, "file"}
+    for name, value in FIELDS.items():
+        assert parts[name].get_content() == value
+    assert parts["file"].get_filename() == "audio.wav"
+    assert parts["file"].get_content_type() == "audio/wav"
+    assert parts["file"].get_payload(decode=True) == WAV_HEADER + PCM
+
+
+def test_small_reads_and_iteration_give_the_same_body():
+    upload = make_upload()
+    # Iterating doesn't move the read position
+    body = b"".join(upload)
+
+    assert read_all(upload, 7) == body
+    assert len(upload) == len(body)
+    assert upload.read(7) == b""
+
+
+def test_requests_sends_content_length_of_the_body():
+    upload = make_upload()
+    request = requests.Request(
+        "POST",
+        "http://127.0.0.1:8080/inference",
+        data=upload,
+        headers={"Content-Type": upload.content_type},
+    ).prepare()
+
+    assert "Transfer-Encoding" not in request.headers
+    body = read_all(request.body, 8192)
+    assert request.headers["Content-Length"] == str(len(body))
+    assert parse(request.headers["Content-Type"], body)["file"].get_payload(
+        decode=True
+    ) == (WAV_HEADER + PCM)